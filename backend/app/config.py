@@ -100,6 +100,9 @@ class Settings(BaseSettings):
     rate_limit_requests: int = 100
     rate_limit_window: int = 60  # seconds
 
+    # Maximum in-flight Gemini calls per process (resume analysis streams)
+    max_concurrent_llm: int = 16
+
     # File Upload
     max_upload_size: int = 5 * 1024 * 1024  # 5MB
 
@@ -10,7 +10,7 @@ from google.cloud.firestore_v1.base_query import FieldFilter
 
 from app.config import get_settings
 from app.routers import auth, coach, company_intel, feedback, interview, jobboard, resume, session, stt, text_interview
-from app.services.firebase_service import initialize_firebase
+from app.services.firebase_service import get_firestore_client, initialize_firebase
 
 settings = get_settings()
 
@@ -94,6 +94,15 @@ async def lifespan(app: FastAPI):
         print(f"[Firebase] Failed to initialize Admin SDK: {e}")
         print("[Firebase] Authentication and Firestore features will be unavailable")
 
+    # Prewarm the shared Firestore client's gRPC channel (TLS + HTTP/2
+    # handshake) with a trivial read so the first real request doesn't pay it
+    try:
+        db = get_firestore_client()
+        await asyncio.to_thread(db.collection('_warmup').document('_').get)
+        print("[Firebase] Firestore channel prewarmed")
+    except Exception as e:
+        print(f"[Firebase] Firestore prewarm failed (non-fatal): {e}")
+
     # Start background cleanup task
     cleanup_task = asyncio.create_task(cleanup_expired_sessions())
 
@@ -22,6 +22,7 @@ class ResumeVersion(BaseModel):
     file_type: str = Field(..., alias="fileType")  # pdf, docx
     file_size: int = Field(..., alias="fileSize")
     uploaded_at: datetime = Field(..., alias="uploadedAt")
+    uploaded_at_ms: Optional[int] = Field(None, alias="uploadedAtMs")  # epoch ms, used for sorting
     is_ai_improved: bool = Field(default=False, alias="isAiImproved")
     source_version_id: Optional[str] = Field(None, alias="sourceVersionId")
 
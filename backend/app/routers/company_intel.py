@@ -11,7 +11,7 @@ from app.models.company_intel import (
     CompanyIntelResponse,
     CompanyIntel,
 )
-from app.routers.session import get_user_active_session
+from app.routers.session import get_user_active_session, invalidate_active_session
 from app.services.company_intel_service import (
     generate_company_intel,
     get_cache_expiry,
@@ -194,6 +194,7 @@ async def generate_company_intel_endpoint(
                     db.collection('sessions').document(session['session_id']).update({
                         "company_intel": intel.model_dump()
                     })
+                    invalidate_active_session(user.uid)
                     print(f"[CompanyIntel] Saved intel to session {session['session_id']} (no job_id)")
         except Exception as e:
             print(f"[CompanyIntel] Failed to save intel: {e}")
@@ -334,6 +335,7 @@ async def refresh_company_intel(
                 db.collection('sessions').document(session['session_id']).update({
                     "company_intel": intel.model_dump()
                 })
+                invalidate_active_session(user.uid)
                 print(f"[CompanyIntel] Saved refreshed intel to session {session['session_id']}")
         except Exception as e:
             print(f"[CompanyIntel] Failed to save refreshed intel: {e}")
@@ -15,6 +15,7 @@ from app.models.feedback import (
 from app.services.feedback_generator import generate_interview_feedback
 from app.services.firebase_service import get_firestore_client, get_feedback_collection
 from app.middleware.auth_middleware import require_auth, AuthenticatedUser
+from app.routers.session import invalidate_active_session
 
 router = APIRouter()
 
@@ -65,13 +66,28 @@ async def _process_feedback(session_id: str, transcript: list, user_id: str):
         # Use mode='json' to ensure all nested models are properly serialized
         feedback_dict = feedback.model_dump(mode='json', by_alias=True)
 
-        # Store feedback in Firestore
+        # Store the feedback first, on its own commit: generation takes
+        # seconds, and the session doc may have been deleted meanwhile -
+        # that must not lose the feedback itself
         feedback_doc.update({
             'feedback_data': feedback_dict,
             'status': 'completed',
             'progress': 100,
             'generated_at': datetime.utcnow(),
         })
+
+        # Denormalize the overall score onto the session doc so the history
+        # endpoint doesn't need a feedback read per row; fail-soft since the
+        # session may legitimately be gone
+        overall_score = feedback_dict.get('overallScore') or feedback_dict.get('overall_score')
+        if overall_score is not None:
+            try:
+                db.collection('sessions').document(session_id).update({
+                    'overall_score': overall_score,
+                })
+                invalidate_active_session(user_id)
+            except Exception as e:
+                print(f"[Feedback] Could not denormalize score onto session {session_id}: {e}")
         print(f"[Feedback] Successfully generated feedback for session {session_id}")
 
     except Exception as e:
@@ -18,7 +18,7 @@ from app.models.interview import (
     SaveTranscriptBatchRequest,
     StartInterviewResponse,
 )
-from app.routers.session import get_user_active_session
+from app.routers.session import get_user_active_session, invalidate_active_session
 from app.services.elevenlabs_service import (
     get_signed_url,
     build_prompt_overrides,
@@ -90,7 +90,9 @@ async def start_interview(
         # Update session status and interview mode in Firestore
         try:
             db = get_firestore_client()
-            db.collection('sessions').document(session_id).update({"status": "interviewing", "interview_mode": "voice"})
+            db.collection('sessions').document(session_id).update(
+                {"status": "interviewing", "is_active": True, "interview_mode": "voice"})
+            invalidate_active_session(user.uid)
             print(f"[Interview] Updated session {session_id} status to 'interviewing', mode to 'voice'")
         except Exception as e:
             print(f"[Interview] Failed to update session status: {e}")
@@ -139,7 +141,9 @@ async def end_interview(
     # Update session status in Firestore
     try:
         db = get_firestore_client()
-        db.collection('sessions').document(session_id).update({"status": "completed"})
+        db.collection('sessions').document(session_id).update(
+            {"status": "completed", "is_active": False})
+        invalidate_active_session(user.uid)
         print(f"[Interview] Ended interview for session {session_id}")
     except Exception as e:
         print(f"[Interview] Failed to update session status: {e}")
@@ -231,7 +235,9 @@ async def resume_interview(
             'status': 'active',
             'lastActivityAt': datetime.utcnow(),
         })
-        db.collection('sessions').document(session_id).update({"status": "interviewing", "interview_mode": "voice"})
+        db.collection('sessions').document(session_id).update(
+            {"status": "interviewing", "is_active": True, "interview_mode": "voice"})
+        invalidate_active_session(user.uid)
 
         # Calculate expiration (15 minutes from now)
         expires_at = datetime.utcnow() + timedelta(minutes=15)
@@ -513,7 +519,9 @@ async def pause_interview(
             interview_ref.set(interview_data)
 
         # Also update session status
-        db.collection("sessions").document(session_id).update({"status": "paused"})
+        db.collection("sessions").document(session_id).update(
+            {"status": "paused", "is_active": True})
+        invalidate_active_session(user.uid)
 
         print(f"[Interview] Paused interview for session {session_id}")
         return {"status": "paused"}
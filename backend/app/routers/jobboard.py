@@ -1,12 +1,14 @@
 """Job board and career matching endpoints."""
 
+import asyncio
 import json
+from itertools import chain
 from typing import Optional
 from datetime import datetime
 from pydantic import BaseModel
 
 from fastapi import APIRouter, Header, HTTPException, Depends
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 from app.middleware.auth_middleware import require_auth, AuthenticatedUser
 from app.models.job import (
@@ -19,7 +21,7 @@ from app.models.job import (
     JobSearchResponse,
 )
 from app.models.resume import ResumeData
-from app.routers.session import get_user_active_session
+from app.routers.session import get_user_active_session, invalidate_active_session
 from app.services.job_matcher import (
     analyze_career_trajectory,
     analyze_job_fit,
@@ -33,6 +35,10 @@ from google.cloud.firestore_v1.base_query import FieldFilter
 
 router = APIRouter()
 
+# Strong references to cleanup tasks spawned from streaming generators, so
+# the event loop can't garbage-collect them before they finish.
+_cleanup_tasks: set = set()
+
 
 def _get_resume_from_session(session_id: Optional[str]) -> Optional[ResumeData]:
     """Get resume data from session if available. Checks Firestore only."""
@@ -164,6 +170,7 @@ async def search_jobs(
             db.collection('sessions').document(session_id).update({
                 "search_jobs": search_jobs_data
             })
+            invalidate_active_session(user.uid)
             print(f"[JobBoard] Saved search jobs ({len(matched_jobs)} jobs) to session {session_id}")
         except Exception as e:
             # Log but don't fail the request if save fails
@@ -298,6 +305,7 @@ async def get_recommended_jobs(
         db.collection('sessions').document(session_id).update({
             "ai_discovery": ai_discovery_data
         })
+        invalidate_active_session(user.uid)
         print(f"[JobBoard] Saved AI discovery ({len(matched_jobs)} jobs) to session {session_id}")
     except Exception as e:
         # Log but don't fail the request if save fails
@@ -487,6 +495,95 @@ async def get_job_match(
     )
 
 
+# Saved-jobs hydration is chunked across threads; 32 docs per chunk keeps
+# thread count low while pydantic-core releases the GIL during validation.
+_HYDRATE_CHUNK_SIZE = 32
+
+
+def _hydrate_saved_jobs(saved_items: list) -> list:
+    """Build JobMatch objects from a chunk of saved_jobs documents.
+
+    Pure CPU work (Pydantic validation + datetime conversion), safe to run
+    off the event loop. Items that fail to parse are skipped, matching the
+    previous serial-loop behavior.
+    """
+    job_matches = []
+    for item in saved_items:
+        job_id = item.get('job_id')
+        job_data = item.get('job_data')
+
+        if not job_data:
+            print(f"[SavedJobs] Skipping job {job_id}: no job_data stored")
+            continue
+
+        try:
+            job = JobPosting(**job_data)
+
+            # Use cached fit_analysis if available, otherwise use placeholder
+            cached_fit = item.get('fit_analysis') or item.get('fitAnalysis')
+
+            if cached_fit:
+                # Use cached analysis from when job was saved
+                fit_analysis = FitAnalysis(
+                    overall_match=cached_fit.get('overallMatch', cached_fit.get('overall_match', 0)),
+                    skill_match=cached_fit.get('skillMatch', cached_fit.get('skill_match', 0)),
+                    experience_match=cached_fit.get('experienceMatch', cached_fit.get('experience_match', 0)),
+                    culture_signals=cached_fit.get('cultureSignals', cached_fit.get('culture_signals')),
+                    strengths_for_role=cached_fit.get('strengthsForRole', cached_fit.get('strengths_for_role', [])),
+                    potential_concerns=cached_fit.get('potentialConcerns', cached_fit.get('potential_concerns', [])),
+                    interview_focus_areas=cached_fit.get('interviewFocusAreas', cached_fit.get('interview_focus_areas', [])),
+                    preparation_priority=cached_fit.get('preparationPriority', cached_fit.get('preparation_priority', [])),
+                    skill_matches=cached_fit.get('skillMatches', cached_fit.get('skill_matches', [])),
+                )
+            else:
+                # Placeholder for jobs without cached analysis
+                fit_analysis = FitAnalysis(
+                    overall_match=0,
+                    skill_match=0,
+                    experience_match=0,
+                    strengths_for_role=[],
+                    potential_concerns=[],
+                    interview_focus_areas=[],
+                    preparation_priority=[],
+                    skill_matches=[],
+                )
+
+            # Build JobMatch with metadata from saved_jobs document
+            # Convert datetime objects to ISO strings for JSON serialization
+            cover_letter_at = item.get('cover_letter_generated_at')
+            if cover_letter_at and hasattr(cover_letter_at, 'isoformat'):
+                cover_letter_at = cover_letter_at.isoformat()
+
+            applied_at = item.get('applied_at')
+            if applied_at and hasattr(applied_at, 'isoformat'):
+                applied_at = applied_at.isoformat()
+
+            company_intel_at = item.get('company_intel_generated_at')
+            if company_intel_at and hasattr(company_intel_at, 'isoformat'):
+                company_intel_at = company_intel_at.isoformat()
+
+            job_match = JobMatch(
+                job=job,
+                fit_analysis=fit_analysis,
+                career_trajectory=None,
+                saved=True,
+                applied=item.get('applied', False),
+                cover_letter=item.get('cover_letter'),
+                cover_letter_generated_at=cover_letter_at,
+                application_status=item.get('status', 'saved'),
+                applied_at=applied_at,
+                company_intel=item.get('company_intel'),
+                company_intel_generated_at=company_intel_at,
+            )
+            job_matches.append(job_match)
+
+        except Exception as e:
+            print(f"[SavedJobs] Failed to load job {job_id}: {e}")
+            continue
+
+    return job_matches
+
+
 class SaveJobRequest(BaseModel):
     """Request body for saving a job with optional pre-computed data."""
     fit_analysis: Optional[dict] = None  # Accept cached fit analysis from frontend
@@ -751,8 +848,9 @@ async def generate_cover_letter_endpoint(
         cover_letter = "".join(cover_letter_chunks)
         
         # Check if job is already saved
+        saved_job_id = f"{user.uid}_{job_id}"
         db = get_firestore_client()
-        doc_ref = db.collection('saved_jobs').document(f"{user.uid}_{job_id}")
+        doc_ref = db.collection('saved_jobs').document(saved_job_id)
         doc = doc_ref.get()
         
         job_saved = False
@@ -784,7 +882,7 @@ async def generate_cover_letter_endpoint(
         return CoverLetterResponse(
             cover_letter=cover_letter,
             job_saved=job_saved,
-            saved_job_id=f"{user.uid}_{job_id}",
+            saved_job_id=saved_job_id,
         )
         
     except Exception as e:
@@ -811,14 +909,72 @@ async def generate_cover_letter_stream_endpoint(
     - data: {"error": "message"} on error
     """
     from app.services.cover_letter_service import generate_cover_letter_stream
-    
+
+    saved_job_id = f"{user.uid}_{job_id}"
+
     async def stream_generator():
         full_text = ""
         chunk_count = 0
-        
+
+        db = get_firestore_client()
+        doc_ref = db.collection('saved_jobs').document(saved_job_id)
+
+        async def _save_placeholder() -> bool:
+            """Write the saved-job doc while generation is still streaming.
+
+            Returns True if this created the doc (job newly saved). The final
+            write then only has to update the cover_letter fields instead of
+            re-sending the full job_data payload.
+            """
+            doc = await asyncio.to_thread(doc_ref.get)
+            if doc.exists:
+                return False
+            await asyncio.to_thread(
+                doc_ref.set,
+                {
+                    'user_id': user.uid,
+                    'job_id': job_id,
+                    'job_data': request.job_data.model_dump(),
+                    'saved_at': datetime.utcnow(),
+                    'auto_saved': True,
+                    'explicitly_saved': False,
+                    'cover_letter': '',
+                    'applied': False,
+                    'status': 'saved',
+                },
+                merge=True,
+            )
+            return True
+
+        # Overlap the placeholder write with the LLM stream; the job shows up
+        # in the saved list immediately even if the connection drops mid-stream.
+        placeholder_task = asyncio.create_task(_save_placeholder())
+
+        async def _reconcile_failed_stream():
+            """Settle the placeholder when generation didn't complete.
+
+            Retrieves the placeholder task's result (so a failure there isn't
+            left as an unretrieved task exception) and, if the doc was
+            auto-created for this request, deletes it again - otherwise the
+            saved-jobs list would show a job with a permanently blank cover
+            letter.
+            """
+            try:
+                created = await placeholder_task
+            except Exception as placeholder_error:
+                print(f"[CoverLetter Stream] Placeholder write failed: {placeholder_error}")
+                return
+            if created:
+                try:
+                    await asyncio.to_thread(doc_ref.delete)
+                    print(f"[CoverLetter Stream] Removed auto-saved placeholder {saved_job_id}")
+                except Exception as cleanup_error:
+                    print(f"[CoverLetter Stream] Failed to remove placeholder: {cleanup_error}")
+
+        finished = False
         try:
             print(f"[CoverLetter Stream] Starting for job {job_id}, user {user.uid}")
-            
+
             async for chunk in generate_cover_letter_stream(
                 job=request.job_data,
                 resume_markdown=request.resume_markdown,
@@ -831,45 +987,37 @@ async def generate_cover_letter_stream_endpoint(
             
             print(f"[CoverLetter Stream] Completed with {chunk_count} chunks, {len(full_text)} chars")
             
-            # Save the job with cover letter
+            # Attach the cover letter; the doc itself was written while the
+            # stream was running, so this is a small field-only update.
             job_saved = False
             try:
-                db = get_firestore_client()
-                doc_ref = db.collection('saved_jobs').document(f"{user.uid}_{job_id}")
-                doc = doc_ref.get()
-                
-                if doc.exists:
-                    doc_ref.update({
-                        'cover_letter': full_text,
-                        'cover_letter_generated_at': datetime.utcnow(),
-                    })
-                else:
-                    doc_ref.set({
-                        'user_id': user.uid,
-                        'job_id': job_id,
-                        'job_data': request.job_data.model_dump(),
-                        'saved_at': datetime.utcnow(),
-                        'auto_saved': True,
-                        'explicitly_saved': False,
-                        'cover_letter': full_text,
-                        'cover_letter_generated_at': datetime.utcnow(),
-                        'applied': False,
-                        'status': 'saved',
-                    })
-                    job_saved = True
+                job_saved = await placeholder_task
+                await asyncio.to_thread(doc_ref.update, {
+                    'cover_letter': full_text,
+                    'cover_letter_generated_at': datetime.utcnow(),
+                })
                 print(f"[CoverLetter Stream] Saved to Firestore")
             except Exception as save_error:
                 print(f"[CoverLetter Stream] Failed to save: {save_error}")
             
             # Send completion event
-            yield f"data: {json.dumps({'done': True, 'fullText': full_text, 'jobSaved': job_saved, 'savedJobId': f'{user.uid}_{job_id}'})}\n\n"
-            
+            yield f"data: {json.dumps({'done': True, 'fullText': full_text, 'jobSaved': job_saved, 'savedJobId': saved_job_id})}\n\n"
+            finished = True
+
         except Exception as e:
             print(f"[CoverLetter Stream] Error: {e}")
             import traceback
             traceback.print_exc()
             yield f"data: {json.dumps({'error': str(e)})}\n\n"
-    
+        finally:
+            if not finished:
+                # Stream error or client disconnect: the generator may be
+                # closing (GeneratorExit), so reconcile the placeholder in a
+                # background task instead of awaiting it here.
+                task = asyncio.create_task(_reconcile_failed_stream())
+                _cleanup_tasks.add(task)
+                task.add_done_callback(_cleanup_tasks.discard)
+
     return StreamingResponse(
         stream_generator(),
         media_type="text/event-stream",
@@ -938,7 +1086,7 @@ async def update_job_status(
         raise HTTPException(status_code=500, detail="Failed to update job status")
 
 
-@router.get("/jobs/saved/list", response_model=JobSearchResponse)
+@router.get("/jobs/saved/list", response_model=JobSearchResponse, response_class=ORJSONResponse)
 async def get_saved_jobs(
     user: AuthenticatedUser = Depends(require_auth),
 ):
@@ -966,80 +1114,17 @@ async def get_saved_jobs(
                 career_advice=None,
             )
 
-        # Build job matches from stored data (no AI calls needed)
-        job_matches = []
-        for item in saved_items:
-            job_id = item.get('job_id')
-            job_data = item.get('job_data')
-            
-            if not job_data:
-                print(f"[SavedJobs] Skipping job {job_id}: no job_data stored")
-                continue
-                
-            try:
-                job = JobPosting(**job_data)
-                
-                # Use cached fit_analysis if available, otherwise use placeholder
-                cached_fit = item.get('fit_analysis') or item.get('fitAnalysis')
-                
-                if cached_fit:
-                    # Use cached analysis from when job was saved
-                    fit_analysis = FitAnalysis(
-                        overall_match=cached_fit.get('overallMatch', cached_fit.get('overall_match', 0)),
-                        skill_match=cached_fit.get('skillMatch', cached_fit.get('skill_match', 0)),
-                        experience_match=cached_fit.get('experienceMatch', cached_fit.get('experience_match', 0)),
-                        culture_signals=cached_fit.get('cultureSignals', cached_fit.get('culture_signals')),
-                        strengths_for_role=cached_fit.get('strengthsForRole', cached_fit.get('strengths_for_role', [])),
-                        potential_concerns=cached_fit.get('potentialConcerns', cached_fit.get('potential_concerns', [])),
-                        interview_focus_areas=cached_fit.get('interviewFocusAreas', cached_fit.get('interview_focus_areas', [])),
-                        preparation_priority=cached_fit.get('preparationPriority', cached_fit.get('preparation_priority', [])),
-                        skill_matches=cached_fit.get('skillMatches', cached_fit.get('skill_matches', [])),
-                    )
-                else:
-                    # Placeholder for jobs without cached analysis
-                    fit_analysis = FitAnalysis(
-                        overall_match=0,
-                        skill_match=0,
-                        experience_match=0,
-                        strengths_for_role=[],
-                        potential_concerns=[],
-                        interview_focus_areas=[],
-                        preparation_priority=[],
-                        skill_matches=[],
-                    )
-                
-                # Build JobMatch with metadata from saved_jobs document
-                # Convert datetime objects to ISO strings for JSON serialization
-                cover_letter_at = item.get('cover_letter_generated_at')
-                if cover_letter_at and hasattr(cover_letter_at, 'isoformat'):
-                    cover_letter_at = cover_letter_at.isoformat()
-                
-                applied_at = item.get('applied_at')
-                if applied_at and hasattr(applied_at, 'isoformat'):
-                    applied_at = applied_at.isoformat()
-
-                company_intel_at = item.get('company_intel_generated_at')
-                if company_intel_at and hasattr(company_intel_at, 'isoformat'):
-                    company_intel_at = company_intel_at.isoformat()
-
-                job_match = JobMatch(
-                    job=job,
-                    fit_analysis=fit_analysis,
-                    career_trajectory=None,
-                    saved=True,
-                    applied=item.get('applied', False),
-                    cover_letter=item.get('cover_letter'),
-                    cover_letter_generated_at=cover_letter_at,
-                    application_status=item.get('status', 'saved'),
-                    applied_at=applied_at,
-                    company_intel=item.get('company_intel'),
-                    company_intel_generated_at=company_intel_at,
-                )
-                job_matches.append(job_match)
-                
-            except Exception as e:
-                print(f"[SavedJobs] Failed to load job {job_id}: {e}")
-                continue
+        # Build job matches from stored data (no AI calls needed).
+        # Hydration is chunked across threads so Pydantic validation of large
+        # saved lists doesn't serialize on (or block) the event loop.
+        chunks = [
+            saved_items[i:i + _HYDRATE_CHUNK_SIZE]
+            for i in range(0, len(saved_items), _HYDRATE_CHUNK_SIZE)
+        ]
+        results = await asyncio.gather(
+            *[asyncio.to_thread(_hydrate_saved_jobs, chunk) for chunk in chunks]
+        )
+        job_matches = list(chain.from_iterable(results))
 
         return JobSearchResponse(
             jobs=job_matches,
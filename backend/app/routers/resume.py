@@ -2,18 +2,20 @@
 
 import asyncio
 import io
-import json
-import traceback
+import logging
+import re
+import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime
 from typing import Optional, List
 
+import orjson
 from fastapi import APIRouter, File, HTTPException, Depends, UploadFile
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from pypdf import PdfReader
-from docx import Document
-from google.cloud.firestore_v1 import ArrayUnion, ArrayRemove
+from google.cloud.exceptions import NotFound
+from google.cloud.firestore_v1 import DELETE_FIELD, Increment, transactional
 
 from app.config import get_settings
 from app.models.resume import (
@@ -44,18 +46,110 @@ from app.services.storage_service import (
     download_resume_file,
 )
 from app.middleware.auth_middleware import require_auth, AuthenticatedUser
-from app.routers.session import get_user_active_session
+from app.routers.session import get_user_active_session, invalidate_active_session
 from app.services.firebase_service import get_firestore_client
 
 router = APIRouter()
 settings = get_settings()
 
+# All diagnostics go through the stdlib logger: handlers buffer and format
+# off the hot path, unlike print(), which takes the stdout lock inline, and
+# per-chunk debug messages are never even formatted at the default INFO level
+logger = logging.getLogger(__name__)
+
 # Maximum number of resume versions per user
 MAX_RESUME_VERSIONS = 10
 
+# Accepted upload MIME types mapped to the stored file_type value. Doubles as
+# the allowed-types check in the parse endpoints.
+_CT_TO_FILETYPE = {
+    'application/pdf': 'pdf',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': 'docx',
+}
+
+# Process-wide cap on in-flight Gemini calls from the analysis streams, so a
+# burst of concurrent parse/reparse requests can't spawn unbounded LLM tasks
+_llm_semaphore = asyncio.Semaphore(settings.max_concurrent_llm)
+
+# Short-lived per-user cache of the resume versions list, keyed by uid with a
+# monotonic timestamp. Mutating paths pop the entry, so within a process the
+# cache only ever serves lists no staler than the TTL.
+_VERSIONS_CACHE_TTL = 30.0
+_versions_cache: dict = {}
+
+# Signed download URLs stay valid for 7 days; reuse them for 6 so repeat
+# downloads skip the signing round-trip. LRU-bounded, keyed by storage path.
+_URL_CACHE_TTL = 6 * 24 * 3600.0
+_URL_CACHE_MAX = 1024
+_url_cache: OrderedDict = OrderedDict()
+
+# Module-local Firestore client, resolved once on first use. Firebase is
+# initialized during lifespan startup, so the lookup has to be deferred past
+# import time; after that every request reuses the same client and its gRPC
+# channel pool.
+_db_client = None
+
+
+def _db():
+    """Return the process-wide Firestore client (cached per module)."""
+    global _db_client
+    if _db_client is None:
+        _db_client = get_firestore_client()
+    return _db_client
+
+
+def _version_sort_key(version: dict) -> int:
+    """Integer sort key (epoch ms) for a resume version entry.
+
+    Falls back to parsing the ISO uploaded_at string for entries written
+    before uploaded_at_ms existed.
+    """
+    ms = version.get('uploaded_at_ms')
+    if ms is not None:
+        return ms
+    try:
+        return int(datetime.fromisoformat(version.get('uploaded_at', '')).timestamp() * 1000)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _index_versions(versions: list[dict]) -> dict[str, dict]:
+    """Index version entries by version_id for O(1) lookup."""
+    return {v['version_id']: v for v in versions if 'version_id' in v}
+
+
+def _migrate_legacy_versions(db, user_ref) -> List[dict]:
+    """One-time move of a legacy resume_versions array into the subcollection.
+
+    Versions used to live as an array field on the user document, which forced
+    a full read-modify-write of the array on every upload. Any remaining array
+    is copied into the resume_versions subcollection and removed from the user
+    doc in a single batch.
+    """
+    user_doc = user_ref.get(field_paths=['resume_versions'])
+    legacy = (user_doc.to_dict() or {}).get('resume_versions', []) if user_doc.exists else []
+    if not legacy:
+        return []
+
+    batch = db.batch()
+    for version in legacy:
+        version.setdefault('uploaded_at_ms', _version_sort_key(version))
+        batch.set(
+            user_ref.collection('resume_versions').document(version['version_id']),
+            version,
+        )
+    batch.update(user_ref, {'resume_versions': DELETE_FIELD})
+    batch.commit()
+    logger.info("[Resume] Migrated %s legacy versions to subcollection for %s", len(legacy), user_ref.id)
+
+    legacy.sort(key=_version_sort_key, reverse=True)
+    return legacy
+
 
 async def _get_user_resume_versions(user_id: str) -> List[dict]:
-    """Get all resume versions for a user from their user document.
+    """Get all resume versions for a user from the resume_versions subcollection.
+
+    Users created before the subcollection schema are migrated on first read.
 
     Args:
         user_id: Firebase user UID
@@ -63,17 +157,26 @@ async def _get_user_resume_versions(user_id: str) -> List[dict]:
     Returns:
         List of resume version dicts, sorted by uploaded_at (newest first)
     """
-    db = get_firestore_client()
-    user_doc = db.collection('users').document(user_id).get()
+    cached = _versions_cache.get(user_id)
+    if cached and time.monotonic() - cached[0] < _VERSIONS_CACHE_TTL:
+        return cached[1]
 
-    if not user_doc.exists:
-        return []
+    db = _db()
+    user_ref = db.collection('users').document(user_id)
 
-    user_data = user_doc.to_dict()
-    versions = user_data.get('resume_versions', [])
+    def _read_versions() -> List[dict]:
+        return [
+            doc.to_dict()
+            for doc in user_ref.collection('resume_versions')
+            .order_by('uploaded_at_ms', direction='DESCENDING')
+            .stream()
+        ]
 
-    # Sort by uploaded_at descending (newest first)
-    versions.sort(key=lambda v: v.get('uploaded_at', ''), reverse=True)
+    versions = await asyncio.to_thread(_read_versions)
+    if not versions:
+        versions = await asyncio.to_thread(_migrate_legacy_versions, db, user_ref)
+
+    _versions_cache[user_id] = (time.monotonic(), versions)
     return versions
 
 
@@ -81,86 +184,132 @@ async def _add_resume_version(
     user_id: str,
     version_data: dict,
     set_as_current: bool = True,
+    session_id: Optional[str] = None,
 ) -> None:
-    """Add a resume version to the user's document.
+    """Add a resume version doc to the user's resume_versions subcollection.
 
     Handles the max 10 versions limit by deleting the oldest non-current version
-    if necessary.
+    if necessary. The limit check reads only a resume_versions_count field on
+    the user doc, so the full subcollection is fetched only when at the cap.
+    All Firestore writes (eviction, version doc, counter, current pointer,
+    session link) go out as a single batch commit instead of one RPC each.
 
     Args:
         user_id: Firebase user UID
         version_data: ResumeVersion data as dict
         set_as_current: Whether to set this as the current version
+        session_id: Optional session to link this version to in the same batch
     """
-    db = get_firestore_client()
+    db = _db()
     user_ref = db.collection('users').document(user_id)
+    versions_ref = user_ref.collection('resume_versions')
+
+    # Field-mask read: only the counter and current pointer, not the whole doc
+    user_doc = await asyncio.to_thread(
+        user_ref.get, ['resume_versions_count', 'current_resume_version_id'])
+    user_data = user_doc.to_dict() if user_doc.exists else {}
+    current_version_id = user_data.get('current_resume_version_id')
+
+    count = user_data.get('resume_versions_count')
+    backfill_count = count is None or count < 0
+    if backfill_count:
+        # Users from before the counter existed: derive it once from the
+        # subcollection (this also migrates any legacy versions array)
+        count = len(await _get_user_resume_versions(user_id))
+
+    async def _delete_evicted_file(storage_path: str) -> None:
+        # The Firestore writes must go through even if the GCS delete fails
+        try:
+            await delete_resume_file(storage_path)
+            logger.info("[Resume] Deleted old version file: %s", storage_path)
+        except Exception as e:
+            logger.warning("[Resume] Failed to delete old version file: %s", e)
 
-    # Get current versions
-    versions = await _get_user_resume_versions(user_id)
-    current_version_id = None
-
-    user_doc = user_ref.get()
-    if user_doc.exists:
-        user_data = user_doc.to_dict()
-        current_version_id = user_data.get('current_resume_version_id')
+    batch = db.batch()
+    evicted = 0
+    storage_delete_task = None
 
     # Check if we need to delete oldest version (max 10)
-    if len(versions) >= MAX_RESUME_VERSIONS:
-        # Find oldest version that is NOT the current one
-        versions_sorted = sorted(versions, key=lambda v: v.get('uploaded_at', ''))
-        for old_version in versions_sorted:
-            if old_version.get('version_id') != current_version_id:
-                # Delete from storage
-                storage_path = old_version.get('storage_path')
-                if storage_path:
-                    try:
-                        await delete_resume_file(storage_path)
-                        print(f"[Resume] Deleted old version file: {storage_path}")
-                    except Exception as e:
-                        print(f"[Resume] Warning: Failed to delete old version file: {e}")
-
-                # Remove from array
-                user_ref.update({
-                    'resume_versions': ArrayRemove([old_version])
-                })
-                print(f"[Resume] Removed old version from user doc: {old_version.get('version_id')}")
-                break
-
-    # Add new version to array
-    update_data = {
-        'resume_versions': ArrayUnion([version_data])
+    if count >= MAX_RESUME_VERSIONS:
+        versions = await _get_user_resume_versions(user_id)
+        # Oldest version that is NOT the current one, in a single pass
+        old_version = min(
+            (v for v in versions if v.get('version_id') != current_version_id),
+            key=_version_sort_key,
+            default=None,
+        )
+        if old_version:
+            # Delete from storage concurrently with the batch commit below
+            storage_path = old_version.get('storage_path')
+            if storage_path:
+                storage_delete_task = asyncio.create_task(
+                    _delete_evicted_file(storage_path))
+
+            # Drop the version doc as part of the batch
+            batch.delete(versions_ref.document(old_version['version_id']))
+            logger.info("[Resume] Evicting old version: %s", old_version.get('version_id'))
+            evicted = 1
+
+    # Write the new version doc
+    batch.set(versions_ref.document(version_data['version_id']), version_data)
+
+    # Absolute value when backfilling the counter, atomic increment otherwise
+    user_updates = {
+        'resume_versions_count': (count + 1 - evicted) if backfill_count
+        else Increment(1 - evicted),
     }
-
     if set_as_current:
-        update_data['current_resume_version_id'] = version_data['version_id']
+        user_updates['current_resume_version_id'] = version_data['version_id']
+    batch.set(user_ref, user_updates, merge=True)
 
-    user_ref.update(update_data)
-    print(f"[Resume] Added version {version_data['version_id']} to user {user_id}")
+    if session_id:
+        batch.update(db.collection('sessions').document(session_id), {
+            'resume_version_id': version_data['version_id']
+        })
+
+    if storage_delete_task is not None:
+        await asyncio.gather(storage_delete_task, asyncio.to_thread(batch.commit))
+    else:
+        await asyncio.to_thread(batch.commit)
+    _versions_cache.pop(user_id, None)
+    if session_id:
+        invalidate_active_session(user_id)
+    logger.info("[Resume] Added version %s to user %s", version_data['version_id'], user_id)
 
 
 async def _store_resume_file(
     user_id: str,
-    file_content: bytes,
+    file_content,
     file_name: str,
     content_type: str,
     session_id: str,
     is_improved: bool = False,
     source_version_id: Optional[str] = None,
+    set_as_current: bool = True,
 ) -> dict:
     """Store a resume file and create a version entry.
 
     Args:
         user_id: Firebase user UID
-        file_content: Raw file bytes
+        file_content: Raw file bytes or a binary file object
         file_name: Original filename
         content_type: MIME type
         session_id: Session to link version to
         is_improved: Whether this is an AI-improved version
         source_version_id: If improved, the original version ID
+        set_as_current: Whether the new version becomes the current one
 
     Returns:
         Version data dict
     """
+    # Measure size before the upload consumes a file object's position
+    if isinstance(file_content, (bytes, bytearray)):
+        file_size = len(file_content)
+    else:
+        file_content.seek(0, io.SEEK_END)
+        file_size = file_content.tell()
+        file_content.seek(0)
+
     # Upload to Firebase Storage
     version_id, storage_path, download_url = await upload_resume_file(
         user_id=user_id,
@@ -172,37 +321,29 @@ async def _store_resume_file(
     )
 
     # Determine file type
-    if 'pdf' in content_type.lower():
-        file_type = 'pdf'
-    elif 'docx' in content_type.lower() or 'wordprocessingml' in content_type.lower():
-        file_type = 'docx'
-    else:
-        file_type = 'pdf'
+    file_type = _CT_TO_FILETYPE.get(content_type, 'pdf')
 
     # Create version data
+    uploaded_at = datetime.utcnow()
     version_data = {
         'version_id': version_id,
         'storage_path': storage_path,
         'download_url': download_url,
         'file_name': file_name,
         'file_type': file_type,
-        'file_size': len(file_content),
-        'uploaded_at': datetime.utcnow().isoformat(),
+        'file_size': file_size,
+        'uploaded_at': uploaded_at.isoformat(),  # kept for display
+        'uploaded_at_ms': int(uploaded_at.timestamp() * 1000),  # integer sort key
         'is_ai_improved': is_improved,
     }
 
     if source_version_id:
         version_data['source_version_id'] = source_version_id
 
-    # Add to user's versions
-    await _add_resume_version(user_id, version_data, set_as_current=True)
-
-    # Link version to session
-    db = get_firestore_client()
-    db.collection('sessions').document(session_id).update({
-        'resume_version_id': version_id
-    })
-    print(f"[Resume] Linked version {version_id} to session {session_id}")
+    # Add to user's versions and link to the session in the same batch commit
+    await _add_resume_version(
+        user_id, version_data, set_as_current=set_as_current, session_id=session_id)
+    logger.info("[Resume] Linked version %s to session %s", version_id, session_id)
 
     return version_data
 
@@ -254,9 +395,115 @@ class GetImprovedResumeResponse(BaseModel):
         populate_by_name = True
 
 
+# Direct snake_case -> camelCase copies for the basic parse payload
+_BASIC_FIELD_MAP = {
+    'name': 'name',
+    'email': 'email',
+    'phone': 'phone',
+    'skills': 'skills',
+    'summary': 'summary',
+    'key_achievements': 'keyAchievements',
+    'suggested_roles': 'suggestedRoles',
+}
+
+
+def _convert_experience(exp: dict) -> dict:
+    """Convert one experience entry to frontend field names."""
+    converted = {
+        'title': exp.get('title', ''),
+        'company': exp.get('company', ''),
+        'duration': exp.get('duration', ''),
+        'highlights': exp.get('highlights', []),
+    }
+    if 'start_date' in exp:
+        converted['startDate'] = exp['start_date']
+    if 'end_date' in exp:
+        converted['endDate'] = exp['end_date']
+    return converted
+
+
+def _convert_education(edu: dict) -> dict:
+    """Convert one education entry to frontend field names."""
+    converted = {
+        'degree': edu.get('degree', ''),
+        'institution': edu.get('institution', ''),
+        'year': edu.get('year', ''),
+    }
+    if 'graduation_year' in edu:
+        converted['graduationYear'] = edu['graduation_year']
+    return converted
+
+
+def _convert_location(loc: dict) -> dict:
+    """Convert a location dict, tolerating either naming convention."""
+    return {
+        'city': loc.get('city'),
+        'country': loc.get('country'),
+        'countryCode': loc.get('country_code') or loc.get('countryCode'),
+        'stateProvince': loc.get('state_province') or loc.get('stateProvince'),
+        'rawAddress': loc.get('raw_address') or loc.get('rawAddress'),
+    }
+
+
+def _convert_skill_graph(sg: dict) -> dict:
+    return {
+        'technical': sg.get('technical', []),
+        'soft': sg.get('soft', []),
+        'domain': sg.get('domain', []),
+        'certifications': sg.get('certifications', []),
+    }
+
+
+def _convert_career_signals(cs: dict) -> dict:
+    # Gemini returns: seniority_level, industry_focus, career_trajectory, years_experience
+    return {
+        'seniorityLevel': cs.get('seniority_level', ''),
+        'industryFocus': cs.get('industry_focus', []),
+        'careerTrajectory': cs.get('career_trajectory', ''),
+        'yearsExperience': cs.get('years_experience'),
+    }
+
+
+def _convert_star_stories(stories: list) -> list:
+    return [
+        {
+            'theme': story.get('theme', ''),
+            'situation': story.get('situation', ''),
+            'task': story.get('task', ''),
+            'action': story.get('action', ''),
+            'result': story.get('result', ''),
+            'metrics': story.get('metrics', []),
+            'keywords': story.get('keywords', []),
+        }
+        for story in stories
+    ]
+
+
+def _convert_talking_points(tp: dict) -> dict:
+    # Gemini returns: elevator_pitch, key_strengths, unique_value
+    return {
+        'elevatorPitch': tp.get('elevator_pitch', ''),
+        'keyStrengths': tp.get('key_strengths', []),
+        'uniqueValue': tp.get('unique_value', ''),
+    }
+
+
+# Structured career-analysis fields: snake_case key -> (camelCase key, converter)
+_CAREER_CONVERTERS = {
+    'skill_graph': ('skillGraph', _convert_skill_graph),
+    'career_signals': ('careerSignals', _convert_career_signals),
+    'star_stories': ('starStories', _convert_star_stories),
+    'talking_points': ('talkingPoints', _convert_talking_points),
+}
+
+
 def _convert_to_frontend_format(data: dict, is_basic: bool = True) -> dict:
     """Convert snake_case backend fields to camelCase frontend format.
 
+    Table-driven: plain renames come from _BASIC_FIELD_MAP, structured fields
+    go through their converter in _CAREER_CONVERTERS, instead of a long
+    per-field if chain.
+
     Args:
         data: Raw data from Gemini parsing
         is_basic: True for basic data, False for career analysis data
@@ -267,144 +514,52 @@ def _convert_to_frontend_format(data: dict, is_basic: bool = True) -> dict:
     if not data:
         return {}
 
-    result = {}
-
     if is_basic:
-        # Basic fields - direct copy
-        if 'name' in data:
-            result['name'] = data['name']
-        if 'email' in data:
-            result['email'] = data['email']
-        if 'phone' in data:
-            result['phone'] = data['phone']
-        if 'skills' in data:
-            result['skills'] = data['skills']
-
-        # experience -> experiences (also convert nested fields)
+        result = {
+            camel: data[snake]
+            for snake, camel in _BASIC_FIELD_MAP.items()
+            if snake in data
+        }
         if 'experience' in data:
-            experiences = []
-            for exp in data.get('experience', []):
-                converted_exp = {
-                    'title': exp.get('title', ''),
-                    'company': exp.get('company', ''),
-                    'duration': exp.get('duration', ''),
-                    'highlights': exp.get('highlights', []),
-                }
-                # Convert date fields if present
-                if 'start_date' in exp:
-                    converted_exp['startDate'] = exp['start_date']
-                if 'end_date' in exp:
-                    converted_exp['endDate'] = exp['end_date']
-                experiences.append(converted_exp)
-            result['experiences'] = experiences
-
-        # education - convert nested fields
+            result['experiences'] = [_convert_experience(e) for e in data.get('experience', [])]
         if 'education' in data:
-            education_list = []
-            for edu in data.get('education', []):
-                converted_edu = {
-                    'degree': edu.get('degree', ''),
-                    'institution': edu.get('institution', ''),
-                    'year': edu.get('year', ''),
-                }
-                if 'graduation_year' in edu:
-                    converted_edu['graduationYear'] = edu['graduation_year']
-                education_list.append(converted_edu)
-            result['education'] = education_list
-
-        # key_achievements -> keyAchievements
-        if 'key_achievements' in data:
-            result['keyAchievements'] = data['key_achievements']
-
-        # suggested_roles -> suggestedRoles
-        if 'suggested_roles' in data:
-            result['suggestedRoles'] = data['suggested_roles']
-
-        # location - convert nested snake_case to camelCase
-        if 'location' in data and data['location']:
-            loc = data['location']
-            result['location'] = {
-                'city': loc.get('city'),
-                'country': loc.get('country'),
-                'countryCode': loc.get('country_code') or loc.get('countryCode'),
-                'stateProvince': loc.get('state_province') or loc.get('stateProvince'),
-                'rawAddress': loc.get('raw_address') or loc.get('rawAddress'),
-            }
-
-        # summary
-        if 'summary' in data:
-            result['summary'] = data['summary']
-
-    else:
-        # Career analysis fields
-
-        # skill_graph -> skillGraph
-        if 'skill_graph' in data and data['skill_graph']:
-            sg = data['skill_graph']
-            result['skillGraph'] = {
-                'technical': sg.get('technical', []),
-                'soft': sg.get('soft', []),
-                'domain': sg.get('domain', []),
-                'certifications': sg.get('certifications', []),
-            }
-
-        # career_signals -> careerSignals
-        # Gemini returns: seniority_level, industry_focus, career_trajectory, years_experience
-        # Frontend expects: seniorityLevel, industryFocus, careerTrajectory, yearsExperience
-        if 'career_signals' in data and data['career_signals']:
-            cs = data['career_signals']
-            result['careerSignals'] = {
-                'seniorityLevel': cs.get('seniority_level', ''),
-                'industryFocus': cs.get('industry_focus', []),
-                'careerTrajectory': cs.get('career_trajectory', ''),
-                'yearsExperience': cs.get('years_experience'),
-            }
+            result['education'] = [_convert_education(e) for e in data.get('education', [])]
+        if data.get('location'):
+            result['location'] = _convert_location(data['location'])
+        return result
+
+    return {
+        camel: convert(data[snake])
+        for snake, (camel, convert) in _CAREER_CONVERTERS.items()
+        if data.get(snake)
+    }
 
-        # star_stories -> starStories
-        # Gemini returns: theme, situation, task, action, result, metrics, keywords
-        # Frontend expects: theme, situation, task, action, result, metrics, keywords
-        if 'star_stories' in data and data['star_stories']:
-            stories = []
-            for story in data.get('star_stories', []):
-                stories.append({
-                    'theme': story.get('theme', ''),
-                    'situation': story.get('situation', ''),
-                    'task': story.get('task', ''),
-                    'action': story.get('action', ''),
-                    'result': story.get('result', ''),
-                    'metrics': story.get('metrics', []),
-                    'keywords': story.get('keywords', []),
-                })
-            result['starStories'] = stories
-
-        # talking_points -> talkingPoints
-        # Gemini returns: elevator_pitch, key_strengths, unique_value
-        # Frontend expects: elevatorPitch, keyStrengths, uniqueValue
-        if 'talking_points' in data and data['talking_points']:
-            tp = data['talking_points']
-            result['talkingPoints'] = {
-                'elevatorPitch': tp.get('elevator_pitch', ''),
-                'keyStrengths': tp.get('key_strengths', []),
-                'uniqueValue': tp.get('unique_value', ''),
-            }
 
-    return result
+# pypdf and python-docx are imported lazily on first use: they are heavy
+# imports that requests other than file parsing never need.
+_PdfReader = None
+_DocxDocument = None
 
 
-def _extract_pdf_text(content: bytes) -> str:
-    """Extract text from PDF bytes."""
-    reader = PdfReader(io.BytesIO(content))
-    text_parts = []
-    for page in reader.pages:
-        text = page.extract_text()
-        if text:
-            text_parts.append(text)
-    return "\n".join(text_parts)
+def _extract_pdf_text(source) -> str:
+    """Extract text from PDF bytes or a binary file object."""
+    global _PdfReader
+    if _PdfReader is None:
+        from pypdf import PdfReader as _PdfReader
+    reader = _PdfReader(io.BytesIO(source) if isinstance(source, bytes) else source)
+    # Feed page text straight into the join instead of growing an
+    # intermediate list of page strings
+    return "\n".join(
+        text for page in reader.pages if (text := page.extract_text())
+    )
 
 
-def _extract_docx_text(content: bytes) -> str:
-    """Extract text from DOCX bytes."""
-    doc = Document(io.BytesIO(content))
+def _extract_docx_text(source) -> str:
+    """Extract text from DOCX bytes or a binary file object."""
+    global _DocxDocument
+    if _DocxDocument is None:
+        from docx import Document as _DocxDocument
+    doc = _DocxDocument(io.BytesIO(source) if isinstance(source, bytes) else source)
     text_parts = []
     for paragraph in doc.paragraphs:
         if paragraph.text.strip():
@@ -412,6 +567,214 @@ def _extract_docx_text(content: bytes) -> str:
     return "\n".join(text_parts)
 
 
+def _sse(event: dict) -> bytes:
+    """Serialize one SSE frame with orjson; StreamingResponse accepts bytes."""
+    return b"data: " + orjson.dumps(event) + b"\n\n"
+
+
+def _sse_error_response(event: dict) -> StreamingResponse:
+    """Single-frame SSE response for validation failures in stream endpoints.
+
+    Pre-encodes the frame once instead of each endpoint defining its own
+    one-shot error_stream closure.
+    """
+    frame = _sse(event)
+
+    async def _gen():
+        yield frame
+
+    return StreamingResponse(_gen(), media_type="text/event-stream")
+
+
+# SSE comment frame: ignored by clients per spec, but keeps proxies
+# (nginx, Cloud Run) from idling out the connection during long Gemini calls
+_KEEPALIVE = b":keepalive\n\n"
+_KEEPALIVE_INTERVAL = 5.0
+
+
+async def _stream_analysis_events(raw_text: str, results: dict, log_prefix: str):
+    """Run the three Gemini parse tasks (plus the auto-triggered improve task)
+    in parallel, yielding one SSE event dict as each completes. While no task
+    finishes within _KEEPALIVE_INTERVAL, pre-serialized keepalive comment
+    frames (bytes) are yielded so the connection never goes quiet.
+
+    Task outputs are accumulated into the caller's ``results`` dict under the
+    'basic'/'career'/'ats'/'improve' keys. Shared by parse_resume_stream and
+    reparse_stored_resume_stream, which differ only in how they persist the
+    merged results afterwards.
+    """
+    start_time = time.time()
+
+    # Each task pushes its (name, result-or-exception) onto the queue the
+    # moment it finishes; the loop below just drains the queue, rather than
+    # re-scanning every pending future per wakeup as asyncio.wait does.
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def _runner(name: str, coro):
+        try:
+            async with _llm_semaphore:
+                result = await coro
+            queue.put_nowait((name, result))
+        except Exception as e:
+            queue.put_nowait((name, e))
+
+    # Keep strong references to the in-flight tasks: the event loop only
+    # holds weak ones, so an un-referenced task can be garbage-collected
+    # mid-execution
+    tasks: set = set()
+
+    def _spawn(name: str, coro) -> None:
+        task = asyncio.create_task(_runner(name, coro))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    _spawn('basic', _parse_resume_basic(raw_text))
+    _spawn('career', _parse_resume_career_analysis(raw_text))
+    _spawn('ats', calculate_ats_score_and_keywords(raw_text, [], None))
+    outstanding = 3
+
+    while outstanding:
+        try:
+            task_name, result = await asyncio.wait_for(
+                queue.get(), timeout=_KEEPALIVE_INTERVAL)
+        except asyncio.TimeoutError:
+            yield _KEEPALIVE
+            continue
+        outstanding -= 1
+        elapsed = time.time() - start_time
+
+        if isinstance(result, Exception):
+            logger.error("%s Task %s failed: %s", log_prefix, task_name, result)
+            yield {'type': 'error', 'task': task_name, 'message': str(result)}
+            continue
+
+        if task_name == 'basic':
+            # Convert to frontend format (camelCase) and store converted version
+            frontend_basic = _convert_to_frontend_format(result, is_basic=True)
+            results['basic'] = frontend_basic  # Store camelCase for Firestore
+            logger.info("%s Basic done in %.2fs, fields: %s", log_prefix, elapsed, list(frontend_basic.keys()))
+            yield {'type': 'basic', 'data': frontend_basic}
+
+        elif task_name == 'career':
+            # Convert to frontend format (camelCase) and store converted version
+            frontend_career = _convert_to_frontend_format(result, is_basic=False)
+            results['career'] = frontend_career  # Store camelCase for Firestore
+            logger.info("%s Career done in %.2fs, fields: %s", log_prefix, elapsed, list(frontend_career.keys()))
+            yield {'type': 'career', 'data': frontend_career}
+
+        elif task_name == 'ats':
+            results['ats'] = result
+            logger.info("%s ATS done in %.2fs", log_prefix, elapsed)
+            yield {'type': 'ats', 'data': result}
+
+            # Auto-trigger improve when ATS completes
+            _spawn('improve', generate_improved_resume(
+                raw_text=raw_text,
+                ats_issues=result.get('ats_issues', []),
+                keyword_gaps=result.get('keyword_gaps', []),
+                formatting_tips=result.get('formatting_tips', []),
+                industry_keywords=result.get('industry_keywords', {}),
+            ))
+            outstanding += 1
+            logger.info("%s Auto-triggered improve task", log_prefix)
+
+        elif task_name == 'improve':
+            results['improve'] = result
+            logger.info("%s Improve done in %.2fs", log_prefix, elapsed)
+            yield {'type': 'improve', 'data': result}
+
+
+async def _create_session(
+    user_id: str,
+    resume_data: dict,
+    improved_markdown: Optional[str] = None,
+    resume_version_id: Optional[str] = None,
+) -> str:
+    """Create a fresh session doc carrying parsed resume data.
+
+    Shared by the parse/reparse tails, which previously each built the same
+    session_data dict inline. Returns the new session id.
+    """
+    session_id = str(uuid.uuid4())
+    session_data = {
+        'session_id': session_id,
+        'user_id': user_id,
+        'resume_data': resume_data,
+        'created_at': datetime.utcnow(),
+        'status': 'created',
+        'is_active': True,
+    }
+    if improved_markdown is not None:
+        session_data['improved_resume_markdown'] = improved_markdown
+    if resume_version_id is not None:
+        session_data['resume_version_id'] = resume_version_id
+
+    await asyncio.to_thread(
+        _db().collection('sessions').document(session_id).set, session_data)
+    invalidate_active_session(user_id)
+    return session_id
+
+
+# Field mask for the improve endpoints' session reads: ownership plus the
+# resume text and ATS analysis in both field spellings (sessions written
+# before the camelCase convention still use snake_case)
+_IMPROVE_SESSION_FIELDS = [
+    'user_id',
+    'resume_data.rawText',
+    'resume_data.raw_text',
+    'resume_data.atsAnalysis',
+    'resume_data.ats_analysis',
+]
+
+
+def _extract_improve_inputs(resume_data: dict) -> dict:
+    """Normalize a session's resume_data into generate_improved_resume kwargs.
+
+    Sessions written before the camelCase convention still carry snake_case
+    keys, so both spellings are folded into one lookup here instead of being
+    repeated in every improve handler.
+    """
+    ats = resume_data.get('atsAnalysis') or resume_data.get('ats_analysis', {})
+    return {
+        'raw_text': resume_data.get('rawText') or resume_data.get('raw_text', ''),
+        'ats_issues': ats.get('atsIssues') or ats.get('ats_issues', []),
+        'keyword_gaps': ats.get('keywordGaps') or ats.get('keyword_gaps', []),
+        'formatting_tips': ats.get('formattingTips') or ats.get('formatting_tips', []),
+        'industry_keywords': ats.get('industryKeywords') or ats.get('industry_keywords', {}),
+    }
+
+
+def _merge_stream_results(results: dict, raw_text: str, file_name: str) -> dict:
+    """Merge per-task stream results into the session resume_data payload."""
+    merged_data = {'rawText': raw_text, 'fileName': file_name}
+    merged_data.update(results.get('basic') or {})
+    merged_data.update(results.get('career') or {})
+
+    # Convert ATS data to proper format
+    ats_result = results.get('ats', {})
+    if ats_result:
+        keyword_gaps = [
+            {
+                'keyword': gap.get('keyword'),
+                'category': gap.get('category', 'technical'),
+                'importance': gap.get('importance', 'medium'),
+                'whereToAdd': gap.get('where_to_add'),
+            }
+            for gap in ats_result.get('keyword_gaps', [])
+        ]
+
+        merged_data['atsAnalysis'] = {
+            'atsScore': ats_result.get('ats_score', 70),
+            'scoreBreakdown': ats_result.get('score_breakdown', {}),
+            'atsIssues': ats_result.get('ats_issues', []),
+            'keywordGaps': keyword_gaps,
+            'formattingTips': ats_result.get('formatting_tips', []),
+            'industryKeywords': ats_result.get('industry_keywords', {}),
+        }
+
+    return merged_data
+
+
 @router.post("/resume/parse/stream")
 async def parse_resume_stream(
     file: UploadFile = File(...),
@@ -434,164 +797,75 @@ async def parse_resume_stream(
     - {"type": "error", "message": "..."} - Error occurred
     """
     # Validate file type
-    allowed_types = [
-        "application/pdf",
-        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-    ]
-    if file.content_type not in allowed_types:
-        async def error_stream():
-            yield f"data: {json.dumps({'type': 'error', 'message': 'Invalid file type. Please upload a PDF or DOCX file.'})}\n\n"
-        return StreamingResponse(error_stream(), media_type="text/event-stream")
-
-    # Validate file size
-    content = await file.read()
-    if len(content) > settings.max_upload_size:
-        async def error_stream():
-            yield f"data: {json.dumps({'type': 'error', 'message': f'File too large. Maximum size is {settings.max_upload_size // (1024 * 1024)}MB.'})}\n\n"
-        return StreamingResponse(error_stream(), media_type="text/event-stream")
-
-    # Extract text based on file type
+    if file.content_type not in _CT_TO_FILETYPE:
+        return _sse_error_response({'type': 'error', 'message': 'Invalid file type. Please upload a PDF or DOCX file.'})
+
+    # Validate file size before touching the content: Starlette tracks the
+    # parsed size on UploadFile; fall back to the spooled file's length when
+    # the server didn't provide it
+    upload = file.file
+    file_size = file.size
+    if file_size is None:
+        upload.seek(0, 2)
+        file_size = upload.tell()
+        upload.seek(0)
+    if file_size > settings.max_upload_size:
+        return _sse_error_response({'type': 'error', 'message': f'File too large. Maximum size is {settings.max_upload_size // (1024 * 1024)}MB.'})
+
+    # Extract text based on file type (off-loop: pypdf/python-docx are
+    # synchronous and CPU-bound, and would stall every other SSE connection).
+    # The extractors read straight from the spooled upload file; no
+    # intermediate bytes copy is made for parsing.
     try:
         if file.content_type == "application/pdf":
-            raw_text = _extract_pdf_text(content)
+            raw_text = await asyncio.to_thread(_extract_pdf_text, upload)
         else:
-            raw_text = _extract_docx_text(content)
-        print(f"[Resume Stream] Extracted text length: {len(raw_text)}")
+            raw_text = await asyncio.to_thread(_extract_docx_text, upload)
+        logger.info("[Resume Stream] Extracted text length: %s", len(raw_text))
     except Exception as e:
-        async def error_stream():
-            yield f"data: {json.dumps({'type': 'error', 'message': f'Failed to extract text: {str(e)}'})}\n\n"
-        return StreamingResponse(error_stream(), media_type="text/event-stream")
+        return _sse_error_response({'type': 'error', 'message': f'Failed to extract text: {str(e)}'})
+
+    # Storage upload still needs the raw bytes; read them once, after parsing
+    upload.seek(0)
+    content = await file.read()
 
     async def event_generator():
-        import time
         start_time = time.time()
-        print(f"[Resume Stream] Starting parallel parsing for user {user.uid}")
-
-        # Create tasks for parallel execution
-        basic_task = asyncio.create_task(_parse_resume_basic(raw_text))
-        career_task = asyncio.create_task(_parse_resume_career_analysis(raw_text))
-        ats_task = asyncio.create_task(calculate_ats_score_and_keywords(raw_text, [], None))
-
-        # Track tasks
-        task_map = {
-            basic_task: 'basic',
-            career_task: 'career',
-            ats_task: 'ats',
-        }
-        pending = {basic_task, career_task, ats_task}
+        logger.info("[Resume Stream] Starting parallel parsing for user %s", user.uid)
+
         results = {'raw_text': raw_text, 'file_name': file.filename}
-        improve_task = None
 
         try:
-            while pending:
-                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
-
-                for task in done:
-                    task_name = task_map.get(task, 'improve')
-                    elapsed = time.time() - start_time
-
-                    try:
-                        result = task.result()
-
-                        if task_name == 'basic':
-                            # Convert to frontend format (camelCase) and store converted version
-                            frontend_basic = _convert_to_frontend_format(result, is_basic=True)
-                            results['basic'] = frontend_basic  # Store camelCase for Firestore
-                            print(f"[Resume Stream] Basic done in {elapsed:.2f}s, fields: {list(frontend_basic.keys())}")
-                            yield f"data: {json.dumps({'type': 'basic', 'data': frontend_basic})}\n\n"
-
-                        elif task_name == 'career':
-                            # Convert to frontend format (camelCase) and store converted version
-                            frontend_career = _convert_to_frontend_format(result, is_basic=False)
-                            results['career'] = frontend_career  # Store camelCase for Firestore
-                            print(f"[Resume Stream] Career done in {elapsed:.2f}s, fields: {list(frontend_career.keys())}")
-                            yield f"data: {json.dumps({'type': 'career', 'data': frontend_career})}\n\n"
-
-                        elif task_name == 'ats':
-                            results['ats'] = result
-                            print(f"[Resume Stream] ATS done in {elapsed:.2f}s")
-                            yield f"data: {json.dumps({'type': 'ats', 'data': result})}\n\n"
-
-                            # Auto-trigger improve when ATS completes
-                            ats_issues = result.get('ats_issues', [])
-                            keyword_gaps = result.get('keyword_gaps', [])
-                            formatting_tips = result.get('formatting_tips', [])
-                            industry_keywords = result.get('industry_keywords', {})
-
-                            improve_task = asyncio.create_task(
-                                generate_improved_resume(
-                                    raw_text=raw_text,
-                                    ats_issues=ats_issues,
-                                    keyword_gaps=keyword_gaps,
-                                    formatting_tips=formatting_tips,
-                                    industry_keywords=industry_keywords,
-                                )
-                            )
-                            task_map[improve_task] = 'improve'
-                            pending.add(improve_task)
-                            print(f"[Resume Stream] Auto-triggered improve task")
-
-                        elif task_name == 'improve':
-                            results['improve'] = result
-                            print(f"[Resume Stream] Improve done in {elapsed:.2f}s")
-                            yield f"data: {json.dumps({'type': 'improve', 'data': result})}\n\n"
-
-                    except Exception as task_error:
-                        print(f"[Resume Stream] Task {task_name} failed: {task_error}")
-                        yield f"data: {json.dumps({'type': 'error', 'task': task_name, 'message': str(task_error)})}\n\n"
+            async for event in _stream_analysis_events(raw_text, results, "[Resume Stream]"):
+                yield event if isinstance(event, bytes) else _sse(event)
 
             # Merge results and save to Firestore
-            merged_data = {
-                'rawText': raw_text,
-                'fileName': file.filename,
-                **results.get('basic', {}),
-                **results.get('career', {}),
-            }
-
-            # Convert ATS data to proper format
-            ats_result = results.get('ats', {})
-            if ats_result:
-                keyword_gaps = []
-                for gap in ats_result.get('keyword_gaps', []):
-                    keyword_gaps.append({
-                        'keyword': gap.get('keyword'),
-                        'category': gap.get('category', 'technical'),
-                        'importance': gap.get('importance', 'medium'),
-                        'whereToAdd': gap.get('where_to_add'),
-                    })
-
-                merged_data['atsAnalysis'] = {
-                    'atsScore': ats_result.get('ats_score', 70),
-                    'scoreBreakdown': ats_result.get('score_breakdown', {}),
-                    'atsIssues': ats_result.get('ats_issues', []),
-                    'keywordGaps': keyword_gaps,
-                    'formattingTips': ats_result.get('formatting_tips', []),
-                    'industryKeywords': ats_result.get('industry_keywords', {}),
-                }
+            merged_data = _merge_stream_results(results, raw_text, file.filename)
 
             # Get or create session
-            db = get_firestore_client()
+            db = _db()
             session = await get_user_active_session(user.uid)
 
+            session_write_task = None
             if session:
+                # Doc already exists: run the update concurrently with the
+                # storage upload below (they touch different backends)
                 session_id = session['session_id']
-                db.collection('sessions').document(session_id).update({
-                    'resume_data': merged_data,
-                    'improved_resume_markdown': results.get('improve', ''),
-                })
-                print(f"[Resume Stream] Updated session {session_id}")
+                session_write_task = asyncio.create_task(asyncio.to_thread(
+                    db.collection('sessions').document(session_id).update,
+                    {
+                        'resume_data': merged_data,
+                        'improved_resume_markdown': results.get('improve', ''),
+                    },
+                ))
+                logger.info("[Resume Stream] Updating session %s", session_id)
             else:
-                session_id = str(uuid.uuid4())
-                session_data = {
-                    'session_id': session_id,
-                    'user_id': user.uid,
-                    'resume_data': merged_data,
-                    'improved_resume_markdown': results.get('improve', ''),
-                    'created_at': datetime.utcnow(),
-                    'status': 'created',
-                }
-                db.collection('sessions').document(session_id).set(session_data)
-                print(f"[Resume Stream] Created session {session_id}")
+                # New session: the doc must exist before _store_resume_file
+                # links the version to it, so this write stays sequential
+                session_id = await _create_session(
+                    user.uid, merged_data,
+                    improved_markdown=results.get('improve', ''))
+                logger.info("[Resume Stream] Created session %s", session_id)
 
             # Store file in Firebase Storage and create version entry
             try:
@@ -602,22 +876,28 @@ async def parse_resume_stream(
                     content_type=file.content_type,
                     session_id=session_id,
                 )
-                print(f"[Resume Stream] Stored file version: {version_data['version_id']}")
+                logger.info("[Resume Stream] Stored file version: %s", version_data['version_id'])
                 # Send storage event to frontend
-                yield f"data: {json.dumps({'type': 'storage', 'data': version_data})}\n\n"
+                yield _sse({'type': 'storage', 'data': version_data})
             except Exception as storage_error:
-                print(f"[Resume Stream] Warning: Failed to store file: {storage_error}")
-                print(traceback.format_exc())
+                logger.warning("[Resume Stream] Failed to store file: %s", storage_error, exc_info=True)
                 # Don't fail the stream, just log the error
-                yield f"data: {json.dumps({'type': 'warning', 'message': f'File storage failed: {str(storage_error)}'})}\n\n"
+                yield _sse({'type': 'warning', 'message': f'File storage failed: {str(storage_error)}'})
+
+            if session_write_task:
+                await session_write_task
+                # The lookup above cached the pre-update doc; drop it so the
+                # next active-session read sees the new resume_data
+                invalidate_active_session(user.uid)
+                logger.info("[Resume Stream] Updated session %s", session_id)
 
             total_time = time.time() - start_time
-            print(f"[Resume Stream] All tasks completed in {total_time:.2f}s")
-            yield f"data: {json.dumps({'type': 'complete', 'sessionId': session_id})}\n\n"
+            logger.info("[Resume Stream] All tasks completed in %.2fs", total_time)
+            yield _sse({'type': 'complete', 'sessionId': session_id})
 
         except Exception as e:
-            print(f"[Resume Stream] Fatal error: {e}")
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            logger.error("[Resume Stream] Fatal error: %s", e)
+            yield _sse({'type': 'error', 'message': str(e)})
 
     return StreamingResponse(
         event_generator(),
@@ -663,211 +943,99 @@ async def reparse_stored_resume_stream(
     version = next((v for v in versions if v.get('version_id') == version_id), None)
 
     if not version:
-        async def error_stream():
-            yield f"data: {json.dumps({'type': 'error', 'message': 'Resume version not found or access denied.'})}\n\n"
-        return StreamingResponse(error_stream(), media_type="text/event-stream")
+        return _sse_error_response({'type': 'error', 'message': 'Resume version not found or access denied.'})
 
     storage_path = version.get('storage_path')
     file_name = version.get('file_name', 'resume.pdf')
     file_type = version.get('file_type', 'pdf')
 
     if not storage_path:
-        async def error_stream():
-            yield f"data: {json.dumps({'type': 'error', 'message': 'Resume version has no storage path.'})}\n\n"
-        return StreamingResponse(error_stream(), media_type="text/event-stream")
+        return _sse_error_response({'type': 'error', 'message': 'Resume version has no storage path.'})
 
     # Download file from Firebase Storage
     try:
         content = await download_resume_file(storage_path)
-        print(f"[Reparse Stream] Downloaded file: {storage_path} ({len(content)} bytes)")
+        logger.info("[Reparse Stream] Downloaded file: %s (%s bytes)", storage_path, len(content))
     except Exception as e:
-        async def error_stream():
-            yield f"data: {json.dumps({'type': 'error', 'message': f'Failed to download stored file: {str(e)}'})}\n\n"
-        return StreamingResponse(error_stream(), media_type="text/event-stream")
+        return _sse_error_response({'type': 'error', 'message': f'Failed to download stored file: {str(e)}'})
 
-    # Extract text based on file type
+    # Extract text based on file type (off-loop, see parse_resume_stream)
     try:
         if file_type == 'pdf':
-            raw_text = _extract_pdf_text(content)
+            raw_text = await asyncio.to_thread(_extract_pdf_text, content)
         else:
-            raw_text = _extract_docx_text(content)
-        print(f"[Reparse Stream] Extracted text length: {len(raw_text)}")
+            raw_text = await asyncio.to_thread(_extract_docx_text, content)
+        logger.info("[Reparse Stream] Extracted text length: %s", len(raw_text))
     except Exception as e:
-        async def error_stream():
-            yield f"data: {json.dumps({'type': 'error', 'message': f'Failed to extract text: {str(e)}'})}\n\n"
-        return StreamingResponse(error_stream(), media_type="text/event-stream")
+        return _sse_error_response({'type': 'error', 'message': f'Failed to extract text: {str(e)}'})
 
     async def event_generator():
-        import time
         start_time = time.time()
-        print(f"[Reparse Stream] Starting parallel parsing for user {user.uid}, version {version_id}")
-
-        # Create tasks for parallel execution
-        basic_task = asyncio.create_task(_parse_resume_basic(raw_text))
-        career_task = asyncio.create_task(_parse_resume_career_analysis(raw_text))
-        ats_task = asyncio.create_task(calculate_ats_score_and_keywords(raw_text, [], None))
-
-        # Track tasks
-        task_map = {
-            basic_task: 'basic',
-            career_task: 'career',
-            ats_task: 'ats',
-        }
-        pending = {basic_task, career_task, ats_task}
+        logger.info("[Reparse Stream] Starting parallel parsing for user %s, version %s", user.uid, version_id)
+
         results = {'raw_text': raw_text, 'file_name': file_name}
-        improve_task = None
 
         try:
-            while pending:
-                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
-
-                for task in done:
-                    task_name = task_map.get(task, 'improve')
-                    elapsed = time.time() - start_time
-
-                    try:
-                        result = task.result()
-
-                        if task_name == 'basic':
-                            # Convert to frontend format (camelCase) and store converted version
-                            frontend_basic = _convert_to_frontend_format(result, is_basic=True)
-                            results['basic'] = frontend_basic  # Store camelCase for Firestore
-                            print(f"[Reparse Stream] Basic done in {elapsed:.2f}s, fields: {list(frontend_basic.keys())}")
-                            yield f"data: {json.dumps({'type': 'basic', 'data': frontend_basic})}\n\n"
-
-                        elif task_name == 'career':
-                            # Convert to frontend format (camelCase) and store converted version
-                            frontend_career = _convert_to_frontend_format(result, is_basic=False)
-                            results['career'] = frontend_career  # Store camelCase for Firestore
-                            print(f"[Reparse Stream] Career done in {elapsed:.2f}s, fields: {list(frontend_career.keys())}")
-                            yield f"data: {json.dumps({'type': 'career', 'data': frontend_career})}\n\n"
-
-                        elif task_name == 'ats':
-                            results['ats'] = result
-                            print(f"[Reparse Stream] ATS done in {elapsed:.2f}s")
-                            yield f"data: {json.dumps({'type': 'ats', 'data': result})}\n\n"
-
-                            # Auto-trigger improve when ATS completes
-                            ats_issues = result.get('ats_issues', [])
-                            keyword_gaps = result.get('keyword_gaps', [])
-                            formatting_tips = result.get('formatting_tips', [])
-                            industry_keywords = result.get('industry_keywords', {})
-
-                            improve_task = asyncio.create_task(
-                                generate_improved_resume(
-                                    raw_text=raw_text,
-                                    ats_issues=ats_issues,
-                                    keyword_gaps=keyword_gaps,
-                                    formatting_tips=formatting_tips,
-                                    industry_keywords=industry_keywords,
-                                )
-                            )
-                            task_map[improve_task] = 'improve'
-                            pending.add(improve_task)
-                            print(f"[Reparse Stream] Auto-triggered improve task")
-
-                        elif task_name == 'improve':
-                            results['improve'] = result
-                            print(f"[Reparse Stream] Improve done in {elapsed:.2f}s")
-                            yield f"data: {json.dumps({'type': 'improve', 'data': result})}\n\n"
-
-                    except Exception as task_error:
-                        print(f"[Reparse Stream] Task {task_name} failed: {task_error}")
-                        yield f"data: {json.dumps({'type': 'error', 'task': task_name, 'message': str(task_error)})}\n\n"
+            async for event in _stream_analysis_events(raw_text, results, "[Reparse Stream]"):
+                yield event if isinstance(event, bytes) else _sse(event)
 
             # Merge results and save to Firestore
-            merged_data = {
-                'rawText': raw_text,
-                'fileName': file_name,
-                **results.get('basic', {}),
-                **results.get('career', {}),
-            }
-
-            # Convert ATS data to proper format
-            ats_result = results.get('ats', {})
-            if ats_result:
-                keyword_gaps = []
-                for gap in ats_result.get('keyword_gaps', []):
-                    keyword_gaps.append({
-                        'keyword': gap.get('keyword'),
-                        'category': gap.get('category', 'technical'),
-                        'importance': gap.get('importance', 'medium'),
-                        'whereToAdd': gap.get('where_to_add'),
-                    })
-
-                merged_data['atsAnalysis'] = {
-                    'atsScore': ats_result.get('ats_score', 70),
-                    'scoreBreakdown': ats_result.get('score_breakdown', {}),
-                    'atsIssues': ats_result.get('ats_issues', []),
-                    'keywordGaps': keyword_gaps,
-                    'formattingTips': ats_result.get('formatting_tips', []),
-                    'industryKeywords': ats_result.get('industry_keywords', {}),
-                }
+            merged_data = _merge_stream_results(results, raw_text, file_name)
 
             # Get or create session
-            db = get_firestore_client()
+            db = _db()
             session_id = request.session_id
 
             if session_id:
-                # Update existing session
+                # Update existing session; trying the update directly saves
+                # the get() round-trip in the common case, and NotFound tells
+                # us the session is gone
                 session_ref = db.collection('sessions').document(session_id)
-                session_doc = session_ref.get()
-                if session_doc.exists:
-                    session_ref.update({
+                try:
+                    await asyncio.to_thread(session_ref.update, {
                         'resume_data': merged_data,
                         'resume_version_id': version_id,
                         'improved_resume_markdown': results.get('improve', ''),
                     })
-                    print(f"[Reparse Stream] Updated existing session {session_id}")
-                else:
+                    invalidate_active_session(user.uid)
+                    logger.info("[Reparse Stream] Updated existing session %s", session_id)
+                except NotFound:
                     # Session doesn't exist, create new
-                    session_id = str(uuid.uuid4())
-                    session_data = {
-                        'session_id': session_id,
-                        'user_id': user.uid,
-                        'resume_data': merged_data,
-                        'resume_version_id': version_id,
-                        'improved_resume_markdown': results.get('improve', ''),
-                        'created_at': datetime.utcnow(),
-                        'status': 'created',
-                    }
-                    db.collection('sessions').document(session_id).set(session_data)
-                    print(f"[Reparse Stream] Created new session {session_id}")
+                    session_id = await _create_session(
+                        user.uid, merged_data,
+                        improved_markdown=results.get('improve', ''),
+                        resume_version_id=version_id)
+                    logger.info("[Reparse Stream] Created new session %s", session_id)
             else:
                 # Check for active session or create new
                 session = await get_user_active_session(user.uid)
                 if session:
                     session_id = session['session_id']
-                    db.collection('sessions').document(session_id).update({
-                        'resume_data': merged_data,
-                        'resume_version_id': version_id,
-                        'improved_resume_markdown': results.get('improve', ''),
-                    })
-                    print(f"[Reparse Stream] Updated active session {session_id}")
+                    await asyncio.to_thread(
+                        db.collection('sessions').document(session_id).update, {
+                            'resume_data': merged_data,
+                            'resume_version_id': version_id,
+                            'improved_resume_markdown': results.get('improve', ''),
+                        })
+                    invalidate_active_session(user.uid)
+                    logger.info("[Reparse Stream] Updated active session %s", session_id)
                 else:
-                    session_id = str(uuid.uuid4())
-                    session_data = {
-                        'session_id': session_id,
-                        'user_id': user.uid,
-                        'resume_data': merged_data,
-                        'resume_version_id': version_id,
-                        'improved_resume_markdown': results.get('improve', ''),
-                        'created_at': datetime.utcnow(),
-                        'status': 'created',
-                    }
-                    db.collection('sessions').document(session_id).set(session_data)
-                    print(f"[Reparse Stream] Created session {session_id}")
+                    session_id = await _create_session(
+                        user.uid, merged_data,
+                        improved_markdown=results.get('improve', ''),
+                        resume_version_id=version_id)
+                    logger.info("[Reparse Stream] Created session %s", session_id)
 
             # Note: We do NOT create a new storage version for reparse
             # The file is already stored, we're just re-analyzing it
 
             total_time = time.time() - start_time
-            print(f"[Reparse Stream] All tasks completed in {total_time:.2f}s")
-            yield f"data: {json.dumps({'type': 'complete', 'sessionId': session_id})}\n\n"
+            logger.info("[Reparse Stream] All tasks completed in %.2fs", total_time)
+            yield _sse({'type': 'complete', 'sessionId': session_id})
 
         except Exception as e:
-            print(f"[Reparse Stream] Fatal error: {e}")
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            logger.error("[Reparse Stream] Fatal error: %s", e)
+            yield _sse({'type': 'error', 'message': str(e)})
 
     return StreamingResponse(
         event_generator(),
@@ -890,27 +1058,29 @@ async def parse_resume(
     Requires authentication. Links resume to user's active session.
     """
     # Validate file type
-    allowed_types = [
-        "application/pdf",
-        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-    ]
-    if file.content_type not in allowed_types:
+    if file.content_type not in _CT_TO_FILETYPE:
         raise HTTPException(
             status_code=400,
             detail="Invalid file type. Please upload a PDF or DOCX file.",
         )
 
-    # Validate file size
-    content = await file.read()
-    if len(content) > settings.max_upload_size:
+    # Validate file size without buffering the content into process memory;
+    # Starlette has already spooled the upload (to disk past its threshold)
+    upload = file.file
+    file_size = file.size
+    if file_size is None:
+        upload.seek(0, 2)
+        file_size = upload.tell()
+        upload.seek(0)
+    if file_size > settings.max_upload_size:
         raise HTTPException(
             status_code=400,
             detail=f"File too large. Maximum size is {settings.max_upload_size // (1024 * 1024)}MB.",
         )
 
     try:
-        # Parse the resume
-        parsed_data = await parse_resume_file(content, file.content_type)
+        # Parse the resume straight from the spooled upload file
+        parsed_data = await parse_resume_file(upload, file.content_type)
         
         # Add the filename to the parsed data
         parsed_data.file_name = file.filename
@@ -920,35 +1090,30 @@ async def parse_resume(
 
         # Get user's active session or create new one
         session = await get_user_active_session(user.uid)
-        db = get_firestore_client()
+        db = _db()
 
         if session:
             # Update existing session with resume data
             session_id = session['session_id']
             try:
-                db.collection('sessions').document(session_id).update({"resume_data": resume_dict})
-                print(f"[Resume] Updated session {session_id} with resume data for user {user.uid}")
+                await asyncio.to_thread(
+                    db.collection('sessions').document(session_id).update,
+                    {"resume_data": resume_dict})
+                invalidate_active_session(user.uid)
+                logger.info("[Resume] Updated session %s with resume data for user %s", session_id, user.uid)
             except Exception as e:
-                print(f"[Resume] Failed to update session with resume data: {e}")
+                logger.error("[Resume] Failed to update session with resume data: %s", e)
                 raise HTTPException(
                     status_code=500,
                     detail=f"Failed to save resume to session: {str(e)}"
                 )
         else:
             # Create new session with resume data
-            session_id = str(uuid.uuid4())
-            session_data = {
-                "session_id": session_id,
-                "user_id": user.uid,
-                "resume_data": resume_dict,
-                "created_at": datetime.utcnow(),
-                "status": "created"
-            }
             try:
-                db.collection('sessions').document(session_id).set(session_data)
-                print(f"[Resume] Created new session {session_id} with resume data for user {user.uid}")
+                session_id = await _create_session(user.uid, resume_dict)
+                logger.info("[Resume] Created new session %s with resume data for user %s", session_id, user.uid)
             except Exception as e:
-                print(f"[Resume] Failed to create session with resume data: {e}")
+                logger.error("[Resume] Failed to create session with resume data: %s", e)
                 raise HTTPException(
                     status_code=500,
                     detail=f"Failed to create session: {str(e)}"
@@ -960,7 +1125,7 @@ async def parse_resume(
             message="Resume parsed successfully",
             sessionId=session_id,
         )
-        print(f"[Resume] Returning response for session {session_id}")
+        logger.info("[Resume] Returning response for session %s", session_id)
         return response
     except HTTPException:
         # Re-raise HTTP exceptions as-is
@@ -982,11 +1147,15 @@ async def improve_resume(
     Requires authentication. Uses the session's stored resume data and ATS analysis
     to generate an improved version of the resume in Markdown format.
     """
-    db = get_firestore_client()
+    db = _db()
 
-    # Fetch the session
+    # Fetch the session, projecting only the fields this handler reads
+    # (both field spellings, for sessions written before the camelCase
+    # convention); skips downloading any stored improved markdown
     try:
-        session_doc = db.collection('sessions').document(request.session_id).get()
+        session_doc = await asyncio.to_thread(
+            db.collection('sessions').document(request.session_id).get,
+            _IMPROVE_SESSION_FIELDS)
         if not session_doc.exists:
             raise HTTPException(status_code=404, detail="Session not found")
 
@@ -1006,36 +1175,24 @@ async def improve_resume(
     if not resume_data:
         raise HTTPException(status_code=400, detail="No resume data found in session")
 
-    # Support both camelCase (new) and snake_case (legacy) field names
-    raw_text = resume_data.get('rawText') or resume_data.get('raw_text', '')
-    if not raw_text:
+    # Normalize camelCase/snake_case field names in one place
+    improve_inputs = _extract_improve_inputs(resume_data)
+    if not improve_inputs['raw_text']:
         raise HTTPException(status_code=400, detail="No resume text found in session")
 
-    # Extract ATS analysis data (support both naming conventions)
-    ats_analysis = resume_data.get('atsAnalysis') or resume_data.get('ats_analysis', {})
-    ats_issues = ats_analysis.get('atsIssues') or ats_analysis.get('ats_issues', [])
-    keyword_gaps = ats_analysis.get('keywordGaps') or ats_analysis.get('keyword_gaps', [])
-    formatting_tips = ats_analysis.get('formattingTips') or ats_analysis.get('formatting_tips', [])
-    industry_keywords = ats_analysis.get('industryKeywords') or ats_analysis.get('industry_keywords', {})
-
     # Generate improved resume
     try:
-        improved_markdown = await generate_improved_resume(
-            raw_text=raw_text,
-            ats_issues=ats_issues,
-            keyword_gaps=keyword_gaps,
-            formatting_tips=formatting_tips,
-            industry_keywords=industry_keywords,
-        )
+        improved_markdown = await generate_improved_resume(**improve_inputs)
 
         # Auto-save the improved resume to Firestore
         try:
-            db.collection('sessions').document(request.session_id).update({
-                "improved_resume_markdown": improved_markdown
-            })
-            print(f"[Resume] Auto-saved improved resume to session {request.session_id}")
+            await asyncio.to_thread(
+                db.collection('sessions').document(request.session_id).update,
+                {"improved_resume_markdown": improved_markdown})
+            invalidate_active_session(user.uid)
+            logger.info("[Resume] Auto-saved improved resume to session %s", request.session_id)
         except Exception as save_error:
-            print(f"[Resume] Warning: Failed to auto-save improved resume: {save_error}")
+            logger.warning("[Resume] Failed to auto-save improved resume: %s", save_error)
             # Continue anyway - the resume was generated successfully
 
         return ImproveResumeResponse(
@@ -1044,7 +1201,7 @@ async def improve_resume(
             message="Resume improved successfully",
         )
     except Exception as e:
-        print(f"[Resume] Failed to generate improved resume: {e}")
+        logger.error("[Resume] Failed to generate improved resume: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to generate improved resume: {str(e)}",
@@ -1066,80 +1223,93 @@ async def improve_resume_stream(
     - data: {"done": true, "fullText": "..."} when complete
     - data: {"error": "message"} on error
     """
-    db = get_firestore_client()
+    db = _db()
 
-    # Fetch and validate session
+    # Fetch and validate session, projecting only the fields used here
     try:
-        session_doc = db.collection('sessions').document(request.session_id).get()
+        session_doc = await asyncio.to_thread(
+            db.collection('sessions').document(request.session_id).get,
+            _IMPROVE_SESSION_FIELDS)
         if not session_doc.exists:
-            async def error_stream():
-                yield f"data: {json.dumps({'error': 'Session not found'})}\n\n"
-            return StreamingResponse(error_stream(), media_type="text/event-stream")
+            return _sse_error_response({'error': 'Session not found'})
 
         session_data = session_doc.to_dict()
 
         if session_data.get('user_id') != user.uid:
-            async def error_stream():
-                yield f"data: {json.dumps({'error': 'Unauthorized access to session'})}\n\n"
-            return StreamingResponse(error_stream(), media_type="text/event-stream")
+            return _sse_error_response({'error': 'Unauthorized access to session'})
 
     except Exception as e:
-        async def error_stream():
-            yield f"data: {json.dumps({'error': f'Failed to fetch session: {str(e)}'})}\n\n"
-        return StreamingResponse(error_stream(), media_type="text/event-stream")
+        return _sse_error_response({'error': f'Failed to fetch session: {str(e)}'})
 
     # Extract resume data
     resume_data = session_data.get('resume_data')
     if not resume_data:
-        async def error_stream():
-            yield f"data: {json.dumps({'error': 'No resume data found in session'})}\n\n"
-        return StreamingResponse(error_stream(), media_type="text/event-stream")
-
-    raw_text = resume_data.get('rawText') or resume_data.get('raw_text', '')
-    if not raw_text:
-        async def error_stream():
-            yield f"data: {json.dumps({'error': 'No resume text found in session'})}\n\n"
-        return StreamingResponse(error_stream(), media_type="text/event-stream")
-
-    # Extract ATS analysis data
-    ats_analysis = resume_data.get('atsAnalysis') or resume_data.get('ats_analysis', {})
-    ats_issues = ats_analysis.get('atsIssues') or ats_analysis.get('ats_issues', [])
-    keyword_gaps = ats_analysis.get('keywordGaps') or ats_analysis.get('keyword_gaps', [])
-    formatting_tips = ats_analysis.get('formattingTips') or ats_analysis.get('formatting_tips', [])
-    industry_keywords = ats_analysis.get('industryKeywords') or ats_analysis.get('industry_keywords', {})
+        return _sse_error_response({'error': 'No resume data found in session'})
+
+    # Normalize camelCase/snake_case field names in one place
+    improve_inputs = _extract_improve_inputs(resume_data)
+    if not improve_inputs['raw_text']:
+        return _sse_error_response({'error': 'No resume text found in session'})
 
     async def stream_generator():
-        full_text = ""
+        # Bounded hand-off between the LLM stream and the client: the
+        # producer keeps draining Gemini while the client is momentarily
+        # slow, but blocks on put() once the queue fills instead of
+        # buffering the whole resume in memory
+        queue: asyncio.Queue = asyncio.Queue(maxsize=32)
+
+        async def producer():
+            try:
+                async for chunk in generate_improved_resume_stream(**improve_inputs):
+                    await queue.put(chunk)
+                await queue.put(None)
+            except Exception as e:
+                await queue.put(e)
+
+        producer_task = asyncio.create_task(producer())
+
+        # Accumulate chunks in a list and join once at the end; repeated
+        # str concatenation would recopy the whole text every iteration
+        parts: list[str] = []
         chunk_count = 0
         try:
-            print(f"[Resume Stream] Starting streaming generation for session {request.session_id}")
-            async for chunk in generate_improved_resume_stream(
-                raw_text=raw_text,
-                ats_issues=ats_issues,
-                keyword_gaps=keyword_gaps,
-                formatting_tips=formatting_tips,
-                industry_keywords=industry_keywords,
-            ):
+            logger.info("[Resume Stream] Starting streaming generation for session %s", request.session_id)
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
                 chunk_count += 1
-                full_text += chunk
-                print(f"[Resume Stream] Chunk {chunk_count}: {len(chunk)} chars")
-                yield f"data: {json.dumps({'chunk': chunk})}\n\n"
+                parts.append(item)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[Resume Stream] Chunk %d: %d chars", chunk_count, len(item))
+                yield _sse({'chunk': item})
 
-            # Save the complete resume to Firestore
-            try:
-                db.collection('sessions').document(request.session_id).update({
-                    "improved_resume_markdown": full_text
-                })
-                print(f"[Resume] Auto-saved streamed improved resume to session {request.session_id}")
-            except Exception as save_error:
-                print(f"[Resume] Warning: Failed to auto-save improved resume: {save_error}")
+            full_text = "".join(parts)
+
+            # Kick off the Firestore save, emit done right away, and only
+            # then wait on the save: the client has all the chunks already
+            # and shouldn't pay for the write's round trip
+            save_task = asyncio.create_task(asyncio.to_thread(
+                db.collection('sessions').document(request.session_id).update,
+                {"improved_resume_markdown": full_text}))
 
             # Send completion event
-            yield f"data: {json.dumps({'done': True, 'fullText': full_text})}\n\n"
+            yield _sse({'done': True, 'fullText': full_text})
+
+            try:
+                await save_task
+                invalidate_active_session(user.uid)
+                logger.info("[Resume] Auto-saved streamed improved resume to session %s", request.session_id)
+            except Exception as save_error:
+                logger.warning("[Resume] Failed to auto-save improved resume: %s", save_error)
 
         except Exception as e:
-            print(f"[Resume] Streaming error: {e}")
-            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+            logger.error("[Resume] Streaming error: %s", e)
+            yield _sse({'error': str(e)})
+        finally:
+            producer_task.cancel()
 
     return StreamingResponse(
         stream_generator(),
@@ -1161,10 +1331,14 @@ async def get_improved_resume(
 
     Requires authentication. Returns the improved resume markdown if it exists.
     """
-    db = get_firestore_client()
+    db = _db()
 
     try:
-        session_doc = db.collection('sessions').document(session_id).get()
+        # Project just the ownership field and the markdown; the rest of the
+        # session doc (resume_data etc.) is dead weight here
+        session_doc = await asyncio.to_thread(
+            db.collection('sessions').document(session_id).get,
+            ['user_id', 'improved_resume_markdown'])
         if not session_doc.exists:
             raise HTTPException(status_code=404, detail="Session not found")
 
@@ -1184,7 +1358,7 @@ async def get_improved_resume(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[Resume] Failed to get improved resume: {e}")
+        logger.error("[Resume] Failed to get improved resume: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to get improved resume: {str(e)}",
@@ -1200,24 +1374,30 @@ async def save_improved_resume(
 
     Requires authentication. Allows users to save their edited resume.
     """
-    db = get_firestore_client()
+    db = _db()
 
     try:
-        session_doc = db.collection('sessions').document(request.session_id).get()
-        if not session_doc.exists:
-            raise HTTPException(status_code=404, detail="Session not found")
-
-        session_data = session_doc.to_dict()
+        session_ref = db.collection('sessions').document(request.session_id)
+
+        # Ownership check + write in one transactional round trip instead of
+        # a get() followed by a separate update(); only user_id is read
+        def _verify_and_save():
+            @transactional
+            def _txn(txn):
+                snapshot = session_ref.get(field_paths=['user_id'], transaction=txn)
+                if not snapshot.exists:
+                    raise HTTPException(status_code=404, detail="Session not found")
+                if snapshot.to_dict().get('user_id') != user.uid:
+                    raise HTTPException(status_code=403, detail="Unauthorized access to session")
+                txn.update(session_ref, {
+                    "improved_resume_markdown": request.improved_resume_markdown
+                })
 
-        # Verify user owns this session
-        if session_data.get('user_id') != user.uid:
-            raise HTTPException(status_code=403, detail="Unauthorized access to session")
+            _txn(db.transaction())
 
-        # Update the improved resume markdown
-        db.collection('sessions').document(request.session_id).update({
-            "improved_resume_markdown": request.improved_resume_markdown
-        })
-        print(f"[Resume] Saved improved resume for session {request.session_id}")
+        await asyncio.to_thread(_verify_and_save)
+        invalidate_active_session(user.uid)
+        logger.info("[Resume] Saved improved resume for session %s", request.session_id)
 
         return SaveImprovedResumeResponse(
             success=True,
@@ -1226,7 +1406,7 @@ async def save_improved_resume(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[Resume] Failed to save improved resume: {e}")
+        logger.error("[Resume] Failed to save improved resume: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to save improved resume: {str(e)}",
@@ -1247,11 +1427,15 @@ async def list_resume_versions(
     Returns versions sorted by upload date (newest first), with max 10 versions.
     """
     try:
-        versions = await _get_user_resume_versions(user.uid)
-
-        # Get current version ID
-        db = get_firestore_client()
-        user_doc = db.collection('users').document(user.uid).get()
+        # The versions subcollection and the current-version pointer live in
+        # different documents; fetch both round-trips concurrently
+        db = _db()
+        versions, user_doc = await asyncio.gather(
+            _get_user_resume_versions(user.uid),
+            asyncio.to_thread(
+                db.collection('users').document(user.uid).get,
+                ['current_resume_version_id']),
+        )
         current_version_id = None
         if user_doc.exists:
             current_version_id = user_doc.to_dict().get('current_resume_version_id')
@@ -1263,13 +1447,33 @@ async def list_resume_versions(
             message=f"Found {len(versions)} resume versions",
         )
     except Exception as e:
-        print(f"[Resume] Failed to list versions: {e}")
+        logger.error("[Resume] Failed to list versions: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to list resume versions: {str(e)}",
         )
 
 
+async def _fresh_download_url(storage_path: str) -> str:
+    """Signed download URL for a storage path, reusing recently signed ones.
+
+    Signing costs a round-trip (and CPU) per call; page refreshes hit the
+    download endpoint repeatedly, so URLs are cached until shortly before
+    their 7-day expiry.
+    """
+    cached = _url_cache.get(storage_path)
+    if cached and time.monotonic() - cached[0] < _URL_CACHE_TTL:
+        _url_cache.move_to_end(storage_path)
+        return cached[1]
+
+    url = await get_download_url(storage_path)
+    _url_cache[storage_path] = (time.monotonic(), url)
+    _url_cache.move_to_end(storage_path)
+    while len(_url_cache) > _URL_CACHE_MAX:
+        _url_cache.popitem(last=False)
+    return url
+
+
 @router.get("/resume/versions/{version_id}/download")
 async def get_version_download_url(
     version_id: str,
@@ -1283,12 +1487,7 @@ async def get_version_download_url(
         versions = await _get_user_resume_versions(user.uid)
 
         # Find the requested version
-        version = None
-        for v in versions:
-            if v.get('version_id') == version_id:
-                version = v
-                break
-
+        version = _index_versions(versions).get(version_id)
         if not version:
             raise HTTPException(status_code=404, detail="Resume version not found")
 
@@ -1297,7 +1496,7 @@ async def get_version_download_url(
         if not storage_path:
             raise HTTPException(status_code=500, detail="Version has no storage path")
 
-        fresh_url = await get_download_url(storage_path)
+        fresh_url = await _fresh_download_url(storage_path)
 
         return {
             "success": True,
@@ -1308,7 +1507,7 @@ async def get_version_download_url(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[Resume] Failed to get download URL: {e}")
+        logger.error("[Resume] Failed to get download URL: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to get download URL: {str(e)}",
@@ -1324,11 +1523,12 @@ async def delete_resume_version(
 
     Cannot delete the current version. User must set a different version as current first.
     """
-    db = get_firestore_client()
+    db = _db()
     user_ref = db.collection('users').document(user.uid)
 
     try:
-        user_doc = user_ref.get()
+        user_doc = await asyncio.to_thread(
+            user_ref.get, ['current_resume_version_id'])
         if not user_doc.exists:
             raise HTTPException(status_code=404, detail="User not found")
 
@@ -1343,31 +1543,38 @@ async def delete_resume_version(
             )
 
         # Find the version to delete
-        versions = user_data.get('resume_versions', [])
-        version_to_delete = None
-        for v in versions:
-            if v.get('version_id') == version_id:
-                version_to_delete = v
-                break
-
+        versions = await _get_user_resume_versions(user.uid)
+        version_to_delete = _index_versions(versions).get(version_id)
         if not version_to_delete:
             raise HTTPException(status_code=404, detail="Resume version not found")
 
-        # Delete from storage
-        storage_path = version_to_delete.get('storage_path')
-        if storage_path:
+        async def _delete_from_storage(storage_path: str) -> None:
+            # The Firestore writes must go through even if the GCS delete fails
             try:
                 await delete_resume_file(storage_path)
-                print(f"[Resume] Deleted file from storage: {storage_path}")
+                logger.info("[Resume] Deleted file from storage: %s", storage_path)
             except Exception as storage_error:
-                print(f"[Resume] Warning: Failed to delete from storage: {storage_error}")
+                logger.warning("[Resume] Failed to delete from storage: %s", storage_error)
 
-        # Remove from user's version array
-        user_ref.update({
-            'resume_versions': ArrayRemove([version_to_delete])
-        })
+        # Drop the version doc and decrement the version counter together;
+        # the storage delete hits a different backend, so run it concurrently
+        # with the batch commit instead of paying two sequential round-trips
+        batch = db.batch()
+        batch.delete(user_ref.collection('resume_versions').document(version_id))
+        batch.set(user_ref, {'resume_versions_count': Increment(-1)}, merge=True)
 
-        print(f"[Resume] Deleted version {version_id} for user {user.uid}")
+        storage_path = version_to_delete.get('storage_path')
+        if storage_path:
+            _url_cache.pop(storage_path, None)
+            await asyncio.gather(
+                asyncio.to_thread(batch.commit),
+                _delete_from_storage(storage_path),
+            )
+        else:
+            await asyncio.to_thread(batch.commit)
+        _versions_cache.pop(user.uid, None)
+
+        logger.info("[Resume] Deleted version %s for user %s", version_id, user.uid)
 
         return {
             "success": True,
@@ -1377,7 +1584,7 @@ async def delete_resume_version(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[Resume] Failed to delete version: {e}")
+        logger.error("[Resume] Failed to delete version: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to delete resume version: {str(e)}",
@@ -1390,23 +1597,29 @@ async def set_current_version(
     user: AuthenticatedUser = Depends(require_auth),
 ):
     """Set a specific resume version as the current active version."""
-    db = get_firestore_client()
+    db = _db()
     user_ref = db.collection('users').document(user.uid)
 
     try:
-        # Verify version exists
-        versions = await _get_user_resume_versions(user.uid)
-        version_exists = any(v.get('version_id') == version_id for v in versions)
+        # Existence check + pointer swap in one transactional round trip
+        # instead of streaming the whole versions subcollection first
+        version_ref = user_ref.collection('resume_versions').document(version_id)
+
+        def _verify_and_set():
+            @transactional
+            def _txn(txn):
+                snapshot = version_ref.get(field_paths=['version_id'], transaction=txn)
+                if not snapshot.exists:
+                    raise HTTPException(status_code=404, detail="Resume version not found")
+                txn.update(user_ref, {
+                    'current_resume_version_id': version_id
+                })
 
-        if not version_exists:
-            raise HTTPException(status_code=404, detail="Resume version not found")
+            _txn(db.transaction())
 
-        # Update current version
-        user_ref.update({
-            'current_resume_version_id': version_id
-        })
+        await asyncio.to_thread(_verify_and_set)
 
-        print(f"[Resume] Set current version to {version_id} for user {user.uid}")
+        logger.info("[Resume] Set current version to %s for user %s", version_id, user.uid)
 
         return SetCurrentVersionResponse(
             success=True,
@@ -1415,13 +1628,89 @@ async def set_current_version(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[Resume] Failed to set current version: {e}")
+        logger.error("[Resume] Failed to set current version: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to set current version: {str(e)}",
         )
 
 
+# Single-pass escape table for reportlab markup; one C-level translate per
+# line instead of three chained .replace scans
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+# Classifies a markdown line (heading level or bullet) in one regex match
+# instead of a chain of startswith checks per line
+_MD_LINE_RE = re.compile(r'[ \t]*(#{1,3}) (.*)|[ \t]*[-*] (.*)')
+
+# reportlab styles are immutable across renders; built once on first use.
+# The imports stay lazy, same as the pypdf/docx parsers above.
+_pdf_styles = None
+
+
+def _get_pdf_styles():
+    """Return the (normal, heading, spacer) flowable trio, constructed once.
+
+    The blank-line Spacer is stateless across uses, so one shared instance
+    serves every blank line in every render.
+    """
+    global _pdf_styles
+    if _pdf_styles is None:
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.platypus import Spacer
+        styles = getSampleStyleSheet()
+        heading = ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading1'],
+            fontSize=14,
+            spaceAfter=12,
+            spaceBefore=18,
+        )
+        _pdf_styles = (styles['Normal'], heading, Spacer(1, 6))
+    return _pdf_styles
+
+
+def _render_improved_pdf(improved_markdown: str) -> io.BytesIO:
+    """Render improved-resume markdown into a PDF buffer with reportlab.
+
+    Synchronous and CPU-bound; callers run it via asyncio.to_thread. Returns
+    the buffer rewound to the start so it can stream straight into storage
+    without a full-size bytes copy.
+    """
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Paragraph
+    from reportlab.lib.units import inch
+
+    pdf_buffer = io.BytesIO()
+    doc = SimpleDocTemplate(pdf_buffer, pagesize=letter, topMargin=0.5*inch, bottomMargin=0.5*inch)
+
+    normal_style, heading_style, spacer = _get_pdf_styles()
+
+    # Parse markdown and build PDF content
+    story = []
+    append = story.append  # bound once; the loop body is pure appends
+
+    # Simple markdown to paragraphs conversion; splitlines/rstrip are
+    # C-level and the classifier regex tolerates leading indentation
+    for line in improved_markdown.splitlines():
+        line = line.rstrip()
+        if not line:
+            append(spacer)
+        elif (m := _MD_LINE_RE.fullmatch(line)):
+            if m.group(2) is not None:
+                append(Paragraph(m.group(2), heading_style))
+            else:
+                append(Paragraph(f"• {m.group(3)}", normal_style))
+        else:
+            # Escape special characters and render as paragraph
+            append(Paragraph(line.translate(_HTML_ESCAPE), normal_style))
+
+    doc.build(story)
+
+    pdf_buffer.seek(0)
+    return pdf_buffer
+
+
 @router.post("/resume/improve/pdf", response_model=GenerateImprovedPDFResponse, response_model_by_alias=True)
 async def generate_improved_pdf(
     request: GenerateImprovedPDFRequest,
@@ -1432,17 +1721,12 @@ async def generate_improved_pdf(
     Takes the improved_resume_markdown from the session, converts it to PDF,
     uploads to Firebase Storage as a new version, and optionally sets it as current.
     """
-    from reportlab.lib.pagesizes import letter
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-    from reportlab.lib.units import inch
-    import markdown as md
-
-    db = get_firestore_client()
+    db = _db()
 
     try:
         # Get session
-        session_doc = db.collection('sessions').document(request.session_id).get()
+        session_doc = await asyncio.to_thread(
+            db.collection('sessions').document(request.session_id).get)
         if not session_doc.exists:
             raise HTTPException(status_code=404, detail="Session not found")
 
@@ -1468,69 +1752,24 @@ async def generate_improved_pdf(
         # Get source version ID if available
         source_version_id = session_data.get('resume_version_id')
 
-        # Convert markdown to PDF
-        pdf_buffer = io.BytesIO()
-        doc = SimpleDocTemplate(pdf_buffer, pagesize=letter, topMargin=0.5*inch, bottomMargin=0.5*inch)
-
-        # Get styles
-        styles = getSampleStyleSheet()
-        normal_style = styles['Normal']
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading1'],
-            fontSize=14,
-            spaceAfter=12,
-            spaceBefore=18,
-        )
-
-        # Parse markdown and build PDF content
-        story = []
-
-        # Simple markdown to paragraphs conversion
-        lines = improved_markdown.split('\n')
-        for line in lines:
-            line = line.strip()
-            if not line:
-                story.append(Spacer(1, 6))
-            elif line.startswith('# '):
-                story.append(Paragraph(line[2:], heading_style))
-            elif line.startswith('## '):
-                story.append(Paragraph(line[3:], heading_style))
-            elif line.startswith('### '):
-                story.append(Paragraph(line[4:], heading_style))
-            elif line.startswith('- ') or line.startswith('* '):
-                story.append(Paragraph(f"• {line[2:]}", normal_style))
-            else:
-                # Escape special characters and render as paragraph
-                line = line.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                story.append(Paragraph(line, normal_style))
-
-        doc.build(story)
-
-        # Get PDF bytes
-        pdf_bytes = pdf_buffer.getvalue()
-        pdf_buffer.close()
+        # Convert markdown to PDF off the event loop; reportlab rendering is
+        # CPU-bound and can take hundreds of ms for multi-page resumes
+        pdf_buffer = await asyncio.to_thread(_render_improved_pdf, improved_markdown)
 
         # Upload to storage
         improved_filename = f"{base_name}-improved.pdf"
         version_data = await _store_resume_file(
             user_id=user.uid,
-            file_content=pdf_bytes,
+            file_content=pdf_buffer,
             file_name=improved_filename,
             content_type='application/pdf',
             session_id=request.session_id,
             is_improved=True,
             source_version_id=source_version_id,
+            set_as_current=request.set_as_current,
         )
 
-        # If not setting as current, revert to previous current
-        if not request.set_as_current and source_version_id:
-            user_ref = db.collection('users').document(user.uid)
-            user_ref.update({
-                'current_resume_version_id': source_version_id
-            })
-
-        print(f"[Resume] Generated improved PDF version: {version_data['version_id']}")
+        logger.info("[Resume] Generated improved PDF version: %s", version_data['version_id'])
 
         return GenerateImprovedPDFResponse(
             success=True,
@@ -1540,8 +1779,7 @@ async def generate_improved_pdf(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[Resume] Failed to generate improved PDF: {e}")
-        print(traceback.format_exc())
+        logger.error("[Resume] Failed to generate improved PDF: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to generate improved PDF: {str(e)}",
@@ -1,7 +1,11 @@
 """Session management endpoints."""
 
-import uuid
-from datetime import datetime
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from secrets import token_hex
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Depends
@@ -23,6 +27,45 @@ from app.models.feedback import FeedbackData
 
 router = APIRouter()
 
+# Per-request lookup chatter logs at DEBUG so production (INFO) never even
+# formats the messages; lifecycle writes and failures log at INFO/ERROR
+logger = logging.getLogger(__name__)
+
+# Short-lived per-user cache of the active-session lookup, keyed by uid with a
+# monotonic timestamp. /session/active is polled heavily and the answer rarely
+# changes between polls. The cache holds the full document, so EVERY
+# sessions-doc writer - status changes and content updates (resume_data,
+# improved_resume_markdown, company_intel, job data, scores) alike - must
+# call invalidate_active_session after its write.
+# Session docs can be large (resume_data, job_data), so the cache is
+# LRU-bounded like _url_cache/_token_cache rather than growing per user.
+_ACTIVE_SESSION_TTL = 30.0
+_ACTIVE_SESSION_MAX = 1024
+_active_session_cache: OrderedDict = OrderedDict()
+
+# Session fields a PUT /session/{id} may touch; anything else in the request
+# model is dropped before the Firestore update
+_UPDATABLE_FIELDS = frozenset({
+    'target_role',
+    'target_company',
+    'interview_type',
+    'saved_job_id',
+    'job_data',
+})
+
+
+def invalidate_active_session(user_id: str) -> None:
+    """Drop the cached active-session entry after a status-changing write."""
+    _active_session_cache.pop(user_id, None)
+
+
+def _cache_active_session(user_id: str, session: Optional[dict]) -> None:
+    """Cache a lookup result (found or None), evicting the oldest entries."""
+    _active_session_cache[user_id] = (time.monotonic(), session)
+    _active_session_cache.move_to_end(user_id)
+    while len(_active_session_cache) > _ACTIVE_SESSION_MAX:
+        _active_session_cache.popitem(last=False)
+
 
 async def get_user_active_session(user_id: str) -> Optional[dict]:
     """Get user's most recent ACTIVE session from Firestore.
@@ -33,46 +76,55 @@ async def get_user_active_session(user_id: str) -> Optional[dict]:
 
     Returns None if no active session exists for the user.
     """
+    cached = _active_session_cache.get(user_id)
+    if cached:
+        if time.monotonic() - cached[0] < _ACTIVE_SESSION_TTL:
+            _active_session_cache.move_to_end(user_id)
+            return cached[1]
+        del _active_session_cache[user_id]
+
     try:
         db = get_firestore_client()
-        print(f"[Session] Looking for active session for user: {user_id}")
-
-        # First, let's see ALL sessions for this user (debug)
-        all_sessions = db.collection('sessions')\
-            .where(filter=FieldFilter('user_id', '==', user_id))\
-            .limit(5)\
-            .stream()
-
-        session_list = list(all_sessions)
-        print(f"[Session] Found {len(session_list)} total sessions for user {user_id}")
-
-        for doc in session_list:
-            data = doc.to_dict()
-            print(f"[Session]   - Session {doc.id}: status='{data.get('status')}', created_at={data.get('created_at')}")
-
-        # Now do the actual query with status filter
-        # REMOVED 'completed' - completed sessions are historical, not active
-        # This ensures "New Session" creates a fresh session instead of reusing completed ones
-        session_docs = db.collection('sessions')\
+        logger.debug("[Session] Looking for active session for user: %s", user_id)
+
+        # Query on the denormalized is_active flag - a single equality filter
+        # Firestore serves with one index range scan, where the old
+        # status-in clause fanned out into one sub-query per listed value.
+        # 'completed' sessions carry is_active=False - they are historical,
+        # not active - so "New Session" creates a fresh session instead of
+        # reusing completed ones. Uses the
+        # (user_id asc, is_active asc, created_at desc) composite index.
+        session_query = db.collection('sessions')\
             .where(filter=FieldFilter('user_id', '==', user_id))\
-            .where(filter=FieldFilter('status', 'in', ['created', 'interviewing', 'paused', 'coaching']))\
+            .where(filter=FieldFilter('is_active', '==', True))\
             .order_by('created_at', direction=firestore.Query.DESCENDING)\
-            .limit(1)\
-            .stream()
+            .limit(1)
+        session_docs = await asyncio.to_thread(lambda: list(session_query.stream()))
+
+        if not session_docs:
+            # Sessions written before is_active existed lack the field and
+            # never match the equality filter; fall back to the status filter
+            # for those. The 30s cache keeps this second query off hot paths.
+            legacy_query = db.collection('sessions')\
+                .where(filter=FieldFilter('user_id', '==', user_id))\
+                .where(filter=FieldFilter('status', 'in', ['created', 'interviewing', 'paused', 'coaching']))\
+                .order_by('created_at', direction=firestore.Query.DESCENDING)\
+                .limit(1)
+            session_docs = await asyncio.to_thread(lambda: list(legacy_query.stream()))
 
         # Get first result
         for doc in session_docs:
             session_data = doc.to_dict()
             session_data['session_id'] = doc.id  # Ensure session_id is included
-            print(f"[Session] Found active session: {doc.id}")
+            logger.debug("[Session] Found active session: %s", doc.id)
+            _cache_active_session(user_id, session_data)
             return session_data
 
-        print(f"[Session] No active session found for user {user_id}")
+        logger.debug("[Session] No active session found for user %s", user_id)
+        _cache_active_session(user_id, None)
         return None
     except Exception as e:
-        print(f"[Session] Error getting user active session: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.error("[Session] Error getting user active session: %s", e, exc_info=True)
         return None
 
 
@@ -93,25 +145,25 @@ async def get_user_session_by_id(user_id: str, session_id: str) -> Optional[dict
     """
     try:
         db = get_firestore_client()
-        doc = db.collection('sessions').document(session_id).get()
+        doc = await asyncio.to_thread(db.collection('sessions').document(session_id).get)
 
         if not doc.exists:
-            print(f"[Session] Session {session_id} not found")
+            logger.debug("[Session] Session %s not found", session_id)
             return None
 
         data = doc.to_dict()
 
         # Verify ownership
         if data.get('user_id') != user_id:
-            print(f"[Session] Session {session_id} belongs to different user")
+            logger.debug("[Session] Session %s belongs to different user", session_id)
             return None
 
         data['session_id'] = doc.id
-        print(f"[Session] Retrieved session {session_id} (status: {data.get('status')})")
+        logger.debug("[Session] Retrieved session %s (status: %s)", session_id, data.get('status'))
         return data
 
     except Exception as e:
-        print(f"[Session] Error getting session {session_id}: {e}")
+        logger.error("[Session] Error getting session %s: %s", session_id, e)
         return None
 
 
@@ -128,24 +180,24 @@ async def get_user_session_for_coaching(user_id: str) -> Optional[dict]:
         db = get_firestore_client()
 
         # Include 'completed' status for post-interview coaching
-        session_docs = db.collection('sessions')\
+        session_query = db.collection('sessions')\
             .where(filter=FieldFilter('user_id', '==', user_id))\
             .where(filter=FieldFilter('status', 'in', ['created', 'interviewing', 'paused', 'coaching', 'completed']))\
             .order_by('created_at', direction=firestore.Query.DESCENDING)\
-            .limit(1)\
-            .stream()
+            .limit(1)
+        session_docs = await asyncio.to_thread(lambda: list(session_query.stream()))
 
         for doc in session_docs:
             session_data = doc.to_dict()
             session_data['session_id'] = doc.id
-            print(f"[Session] Found session for coaching: {doc.id} (status: {session_data.get('status')})")
+            logger.debug("[Session] Found session for coaching: %s (status: %s)", doc.id, session_data.get('status'))
             return session_data
 
-        print(f"[Session] No session found for coaching for user {user_id}")
+        logger.debug("[Session] No session found for coaching for user %s", user_id)
         return None
 
     except Exception as e:
-        print(f"[Session] Error getting session for coaching: {e}")
+        logger.error("[Session] Error getting session for coaching: %s", e)
         return None
 
 
@@ -158,8 +210,10 @@ async def create_session(
 
     Requires authentication. Session is saved to Firestore.
     """
-    session_id = str(uuid.uuid4())
-    now = datetime.utcnow()
+    # token_hex is a single os.urandom + hex call — cheaper than building and
+    # formatting a UUID object — and the clients treat session IDs as opaque
+    session_id = token_hex(16)
+    now = datetime.now(tz=timezone.utc)
 
     session_data = {
         "session_id": session_id,
@@ -170,6 +224,10 @@ async def create_session(
         "interview_length": request.interview_length,
         "difficulty_level": request.difficulty_level,
         "status": "created",
+        # Denormalized flag kept in sync with status: True for any
+        # in-progress status, False once completed. Lets the active-session
+        # query use a single equality filter instead of a status-in fan-out.
+        "is_active": True,
         "created_at": now,
         "resume_data": None,
         # Saved job reference (single source of truth for artifacts)
@@ -181,16 +239,21 @@ async def create_session(
     # Save to Firestore
     try:
         db = get_firestore_client()
-        db.collection('sessions').document(session_id).set(session_data)
-        print(f"[Session] Created Firestore session {session_id} for user {user.uid}")
+        await asyncio.to_thread(
+            db.collection('sessions').document(session_id).set, session_data)
+        invalidate_active_session(user.uid)
+        logger.info("[Session] Created Firestore session %s for user %s", session_id, user.uid)
     except Exception as e:
-        print(f"[Session] Failed to save to Firestore: {e}")
+        logger.error("[Session] Failed to save to Firestore: %s", e)
         raise HTTPException(status_code=500, detail="Failed to create session in database")
 
-    return CreateSessionResponse(
-        sessionId=session_id,
+    # model_construct skips validation; fields are ours, not client input.
+    # Note it takes field names, not aliases - FastAPI still serializes the
+    # response by alias.
+    return CreateSessionResponse.model_construct(
+        session_id=session_id,
         status="created",
-        createdAt=now,
+        created_at=now,
     )
 
 
@@ -210,23 +273,23 @@ async def get_active_session(
     Raises:
         HTTPException: 404 if no active session exists
     """
-    print(f"[Session API] /session/active called for user: {user.uid}")
+    logger.debug("[Session API] /session/active called for user: %s", user.uid)
 
     session = await get_user_active_session(user.uid)
 
     if not session:
-        print(f"[Session API] No session found for user: {user.uid}, returning 404")
+        logger.debug("[Session API] No session found for user: %s, returning 404", user.uid)
         raise HTTPException(
             status_code=404,
             detail="No active session found. Please complete setup first."
         )
 
-    print(f"[Session API] Returning session: {session.get('session_id')}, mode: {session.get('interview_mode')}")
-    return CreateSessionResponse(
-        sessionId=session["session_id"],
+    logger.debug("[Session API] Returning session: %s, mode: %s", session.get('session_id'), session.get('interview_mode'))
+    return CreateSessionResponse.model_construct(
+        session_id=session["session_id"],
         status=session["status"],
-        interviewMode=session.get("interview_mode"),
-        createdAt=session["created_at"],
+        interview_mode=session.get("interview_mode"),
+        created_at=session["created_at"],
     )
 
 
@@ -242,24 +305,24 @@ async def get_session(
     # Get session from Firestore
     try:
         db = get_firestore_client()
-        doc = db.collection('sessions').document(session_id).get()
+        doc = await asyncio.to_thread(db.collection('sessions').document(session_id).get)
         if not doc.exists:
             raise HTTPException(status_code=404, detail="Session not found")
         session = doc.to_dict()
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[Session] Firestore lookup failed: {e}")
+        logger.error("[Session] Firestore lookup failed: %s", e)
         raise HTTPException(status_code=500, detail="Failed to retrieve session")
 
     # Verify user owns this session
     if session.get("user_id") != user.uid:
         raise HTTPException(status_code=403, detail="Access denied")
 
-    return CreateSessionResponse(
-        sessionId=session["session_id"],
+    return CreateSessionResponse.model_construct(
+        session_id=session["session_id"],
         status=session["status"],
-        createdAt=session["created_at"],
+        created_at=session["created_at"],
     )
 
 
@@ -275,14 +338,14 @@ async def get_full_session(
     """
     try:
         db = get_firestore_client()
-        doc = db.collection('sessions').document(session_id).get()
+        doc = await asyncio.to_thread(db.collection('sessions').document(session_id).get)
         if not doc.exists:
             raise HTTPException(status_code=404, detail="Session not found")
         session = doc.to_dict()
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[Session] Firestore lookup failed: {e}")
+        logger.error("[Session] Firestore lookup failed: %s", e)
         raise HTTPException(status_code=500, detail="Failed to retrieve session")
 
     # Verify user owns this session
@@ -290,32 +353,32 @@ async def get_full_session(
         raise HTTPException(status_code=403, detail="Access denied")
 
     # Build full response with all data
-    return FullSessionResponse(
-        sessionId=session.get("session_id", session_id),
-        targetRole=session.get("target_role", ""),
-        targetCompany=session.get("target_company"),
-        interviewType=session.get("interview_type", "behavioral"),
-        interviewLength=session.get("interview_length", "short"),
-        difficultyLevel=session.get("difficulty_level", "easy"),
+    return FullSessionResponse.model_construct(
+        session_id=session.get("session_id", session_id),
+        target_role=session.get("target_role", ""),
+        target_company=session.get("target_company"),
+        interview_type=session.get("interview_type", "behavioral"),
+        interview_length=session.get("interview_length", "short"),
+        difficulty_level=session.get("difficulty_level", "easy"),
         status=session.get("status", "created"),
-        createdAt=session.get("created_at"),
+        created_at=session.get("created_at"),
         # Saved job reference
-        savedJobId=session.get("saved_job_id"),
-        jobData=session.get("job_data"),
+        saved_job_id=session.get("saved_job_id"),
+        job_data=session.get("job_data"),
         # Full data
-        resumeData=session.get("resume_data"),
-        improvedResumeMarkdown=session.get("improved_resume_markdown"),
-        companyIntel=session.get("company_intel"),
+        resume_data=session.get("resume_data"),
+        improved_resume_markdown=session.get("improved_resume_markdown"),
+        company_intel=session.get("company_intel"),
         # Job discovery data
-        aiDiscovery=session.get("ai_discovery"),
-        searchJobs=session.get("search_jobs"),
+        ai_discovery=session.get("ai_discovery"),
+        search_jobs=session.get("search_jobs"),
         # Flags
-        hasResumeData=session.get("resume_data") is not None,
-        hasImprovedResume=session.get("improved_resume_markdown") is not None,
-        hasCompanyIntel=session.get("company_intel") is not None,
-        hasAiDiscovery=session.get("ai_discovery") is not None,
-        hasSearchJobs=session.get("search_jobs") is not None,
-        hasSavedJob=session.get("saved_job_id") is not None,
+        has_resume_data=session.get("resume_data") is not None,
+        has_improved_resume=session.get("improved_resume_markdown") is not None,
+        has_company_intel=session.get("company_intel") is not None,
+        has_ai_discovery=session.get("ai_discovery") is not None,
+        has_search_jobs=session.get("search_jobs") is not None,
+        has_saved_job=session.get("saved_job_id") is not None,
     )
 
 
@@ -329,54 +392,53 @@ async def update_session(
 
     Requires authentication. Updates session in Firestore.
     """
-    # Get session from Firestore
+    # Update only provided fields; Pydantic already tracks which were set,
+    # and the allowlist keeps new request fields from reaching Firestore
+    # until they're deliberately added to it
+    update_data = {
+        k: v
+        for k, v in request.model_dump(exclude_unset=True, exclude_none=True).items()
+        if k in _UPDATABLE_FIELDS
+    }
+
+    # Ownership check + write in one transactional round trip instead of a
+    # get() followed by a separate update(); only the response fields are read
     try:
         db = get_firestore_client()
-        doc = db.collection('sessions').document(session_id).get()
-        if not doc.exists:
-            raise HTTPException(status_code=404, detail="Session not found")
-        session = doc.to_dict()
+        session_ref = db.collection('sessions').document(session_id)
+
+        def _verify_and_update():
+            @firestore.transactional
+            def _txn(txn):
+                snapshot = session_ref.get(
+                    field_paths=['user_id', 'session_id', 'status', 'created_at'],
+                    transaction=txn,
+                )
+                if not snapshot.exists:
+                    raise HTTPException(status_code=404, detail="Session not found")
+                data = snapshot.to_dict()
+                if data.get("user_id") != user.uid:
+                    raise HTTPException(status_code=403, detail="Access denied")
+                if update_data:
+                    txn.update(session_ref, update_data)
+                return data
+
+            return _txn(db.transaction())
+
+        session = await asyncio.to_thread(_verify_and_update)
+        if update_data:
+            invalidate_active_session(user.uid)
+            logger.info("[Session] Updated Firestore session %s", session_id)
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[Session] Firestore lookup failed: {e}")
-        raise HTTPException(status_code=500, detail="Failed to retrieve session")
+        logger.error("[Session] Failed to update Firestore: %s", e)
+        raise HTTPException(status_code=500, detail="Failed to update session")
 
-    # Verify user owns this session
-    if session.get("user_id") != user.uid:
-        raise HTTPException(status_code=403, detail="Access denied")
-
-    # Update only provided fields
-    update_data = {}
-    if request.target_role is not None:
-        update_data["target_role"] = request.target_role
-        session["target_role"] = request.target_role
-    if request.target_company is not None:
-        update_data["target_company"] = request.target_company
-        session["target_company"] = request.target_company
-    if request.interview_type is not None:
-        update_data["interview_type"] = request.interview_type
-        session["interview_type"] = request.interview_type
-    if request.saved_job_id is not None:
-        update_data["saved_job_id"] = request.saved_job_id
-        session["saved_job_id"] = request.saved_job_id
-    if request.job_data is not None:
-        update_data["job_data"] = request.job_data
-        session["job_data"] = request.job_data
-
-    # Save updates to Firestore
-    if update_data:
-        try:
-            db.collection('sessions').document(session_id).update(update_data)
-            print(f"[Session] Updated Firestore session {session_id}")
-        except Exception as e:
-            print(f"[Session] Failed to update Firestore: {e}")
-            raise HTTPException(status_code=500, detail="Failed to update session")
-
-    return CreateSessionResponse(
-        sessionId=session["session_id"],
+    return CreateSessionResponse.model_construct(
+        session_id=session["session_id"],
         status=session["status"],
-        createdAt=session["created_at"],
+        created_at=session["created_at"],
     )
 
 
@@ -392,7 +454,7 @@ async def delete_session(
     # Get session from Firestore to verify ownership
     try:
         db = get_firestore_client()
-        doc = db.collection('sessions').document(session_id).get()
+        doc = await asyncio.to_thread(db.collection('sessions').document(session_id).get)
         if not doc.exists:
             raise HTTPException(status_code=404, detail="Session not found")
 
@@ -403,12 +465,13 @@ async def delete_session(
             raise HTTPException(status_code=403, detail="Access denied")
 
         # Delete the session
-        db.collection('sessions').document(session_id).delete()
-        print(f"[Session] Deleted Firestore session {session_id}")
+        await asyncio.to_thread(db.collection('sessions').document(session_id).delete)
+        invalidate_active_session(user.uid)
+        logger.info("[Session] Deleted Firestore session %s", session_id)
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[Session] Firestore deletion failed: {e}")
+        logger.error("[Session] Firestore deletion failed: %s", e)
         raise HTTPException(status_code=500, detail="Failed to delete session")
 
     return DeleteSessionResponse(
@@ -445,47 +508,84 @@ async def get_session_history(
     try:
         db = get_firestore_client()
 
-        # Get total count first
-        all_sessions = db.collection('sessions')\
+        # Get total count via a server-side COUNT aggregation: one integer
+        # comes back instead of streaming every session document
+        count_query = db.collection('sessions')\
             .where(filter=FieldFilter('user_id', '==', user.uid))\
-            .stream()
-        total = sum(1 for _ in all_sessions)
-
-        # Get paginated sessions
+            .count(alias='total')
+        count_result = await asyncio.to_thread(count_query.get)
+        total = int(count_result[0][0].value)
+
+        # Get paginated sessions, projected down to the SessionSummary fields.
+        # Sessions also carry large blobs (company_intel, search_jobs,
+        # ai_discovery, the full resume_data) that the summary never shows;
+        # for resume_data only rawText is projected — in either field
+        # spelling — which is enough for the has-resume flag.
         sessions_query = db.collection('sessions')\
             .where(filter=FieldFilter('user_id', '==', user.uid))\
+            .select([
+                'target_role',
+                'target_company',
+                'interview_type',
+                'status',
+                'created_at',
+                'overall_score',
+                'resume_data.rawText',
+                'resume_data.raw_text',
+                'improved_resume_markdown',
+            ])\
             .order_by('created_at', direction=firestore.Query.DESCENDING)\
             .limit(limit)\
-            .offset(offset)\
-            .stream()
-
-        sessions = []
-        for doc in sessions_query:
-            session_data = doc.to_dict()
-
-            # Try to get overall score from feedback
-            overall_score = None
+            .offset(offset)
+        session_docs = await asyncio.to_thread(lambda: list(sessions_query.stream()))
+        session_rows = [(doc.id, doc.to_dict() or {}) for doc in session_docs]
+
+        # Scores are denormalized onto the session doc when feedback
+        # completes; only sessions whose feedback finished before that
+        # existed still need a feedback read, fetched in one batched RPC
+        overall_scores = {
+            session_id: session_data['overall_score']
+            for session_id, session_data in session_rows
+            if session_data.get('overall_score') is not None
+        }
+        missing_ids = [
+            session_id for session_id, _ in session_rows
+            if session_id not in overall_scores
+        ]
+        if missing_ids:
+            feedback_refs = [db.collection('feedback').document(session_id) for session_id in missing_ids]
             try:
-                feedback_doc = db.collection('feedback').document(doc.id).get()
-                if feedback_doc.exists:
-                    feedback_data = feedback_doc.to_dict()
-                    if feedback_data.get('status') == 'completed':
-                        feedback_content = feedback_data.get('feedback_data', {})
-                        # Try both camelCase (new format) and snake_case (old format) for compatibility
-                        overall_score = feedback_content.get('overallScore') or feedback_content.get('overall_score')
+                feedback_docs = await asyncio.to_thread(
+                    lambda: list(db.get_all(feedback_refs)))
             except Exception:
-                pass  # Feedback not available, that's ok
+                feedback_docs = []  # Feedback not available, that's ok
+
+            for feedback_doc in feedback_docs:
+                if not feedback_doc.exists:
+                    continue
+                feedback_data = feedback_doc.to_dict()
+                if feedback_data.get('status') == 'completed':
+                    feedback_content = feedback_data.get('feedback_data', {})
+                    # Try both camelCase (new format) and snake_case (old format) for compatibility
+                    overall_scores[feedback_doc.id] = (
+                        feedback_content.get('overallScore') or feedback_content.get('overall_score'))
 
-            sessions.append(SessionSummary(
-                sessionId=doc.id,
-                targetRole=session_data.get('target_role', 'Unknown'),
-                targetCompany=session_data.get('target_company'),
-                interviewType=session_data.get('interview_type', 'behavioral'),
+        sessions = []
+        for session_id, session_data in session_rows:
+            overall_score = overall_scores.get(session_id)
+
+            # model_construct skips per-row validation; the fields come from
+            # our own store and FastAPI serializes the response by alias
+            sessions.append(SessionSummary.model_construct(
+                session_id=session_id,
+                target_role=session_data.get('target_role', 'Unknown'),
+                target_company=session_data.get('target_company'),
+                interview_type=session_data.get('interview_type', 'behavioral'),
                 status=session_data.get('status', 'created'),
-                createdAt=session_data.get('created_at', datetime.utcnow()),
-                overallScore=overall_score,
-                hasResumeData=session_data.get('resume_data') is not None,
-                hasImprovedResume=session_data.get('improved_resume_markdown') is not None,
+                created_at=session_data.get('created_at', datetime.now(tz=timezone.utc)),
+                overall_score=overall_score,
+                has_resume_data=session_data.get('resume_data') is not None,
+                has_improved_resume=session_data.get('improved_resume_markdown') is not None,
             ))
 
         return SessionHistoryResponse(
@@ -496,7 +596,7 @@ async def get_session_history(
         )
 
     except Exception as e:
-        print(f"[Session History] Error: {e}")
+        logger.error("[Session History] Error: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to retrieve session history: {str(e)}"
@@ -524,18 +624,25 @@ async def get_session_feedback(
     try:
         db = get_firestore_client()
 
+        # Fetch the session and feedback docs in one batched read; get_all
+        # returns snapshots in arbitrary order, so key them by collection
+        session_ref = db.collection('sessions').document(session_id)
+        feedback_ref = db.collection('feedback').document(session_id)
+        snapshots = await asyncio.to_thread(
+            lambda: list(db.get_all([session_ref, feedback_ref])))
+        by_collection = {snap.reference.parent.id: snap for snap in snapshots}
+
         # Verify session exists and belongs to user
-        session_doc = db.collection('sessions').document(session_id).get()
-        if not session_doc.exists:
+        session_doc = by_collection.get('sessions')
+        if session_doc is None or not session_doc.exists:
             raise HTTPException(status_code=404, detail="Session not found")
 
         session_data = session_doc.to_dict()
         if session_data.get('user_id') != user.uid:
             raise HTTPException(status_code=403, detail="Not authorized to access this session")
 
-        # Get feedback
-        feedback_doc = db.collection('feedback').document(session_id).get()
-        if not feedback_doc.exists:
+        feedback_doc = by_collection.get('feedback')
+        if feedback_doc is None or not feedback_doc.exists:
             raise HTTPException(status_code=404, detail="Feedback not found for this session")
 
         feedback_data = feedback_doc.to_dict()
@@ -552,7 +659,7 @@ async def get_session_feedback(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[Session Feedback] Error: {e}")
+        logger.error("[Session Feedback] Error: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to retrieve feedback: {str(e)}"
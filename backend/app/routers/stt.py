@@ -13,9 +13,12 @@ Protocol:
 """
 
 import asyncio
-import json
+import hashlib
+import time
+from collections import OrderedDict
 from typing import Optional
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 from app.services.firebase_service import verify_firebase_token
@@ -23,6 +26,52 @@ from app.services.stt_service import SpeechToTextSession
 
 router = APIRouter()
 
+# Verified-token cache: Firebase JWT verification does an RSA signature check
+# (plus a possible cert fetch) per call, and reconnecting clients present the
+# same token repeatedly. Claims are cached by token digest until the token's
+# exp claim, capped at 5 minutes. LRU-bounded.
+_TOKEN_CACHE_TTL = 300.0
+_TOKEN_CACHE_MAX = 1024
+_token_cache: OrderedDict = OrderedDict()
+
+# Browsers send 20-40ms PCM frames; coalescing to ~100ms batches (3200 bytes
+# at 16kHz mono 16-bit) cuts the STT queue puts and gRPC sends 3-5x without
+# adding noticeable latency
+_AUDIO_BATCH_BYTES = 3200
+_AUDIO_BATCH_MAX_DELAY = 0.1
+
+
+async def _send_json(websocket: WebSocket, payload: dict) -> None:
+    """Send a dict as a text JSON frame, encoded with orjson.
+
+    Starlette's send_json goes through stdlib json; orjson encodes several
+    times faster, which adds up in the per-transcript fan-out. Text frames
+    are kept so existing clients see no protocol change.
+    """
+    await websocket.send_text(orjson.dumps(payload).decode())
+
+
+async def _verify_token_cached(token: str) -> dict:
+    """Verify a Firebase ID token, serving repeat tokens from the cache."""
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.time()
+
+    cached = _token_cache.get(key)
+    if cached:
+        valid_until, claims = cached
+        if now < valid_until:
+            _token_cache.move_to_end(key)
+            return claims
+        del _token_cache[key]
+
+    claims = await verify_firebase_token(token)
+    valid_until = min(now + _TOKEN_CACHE_TTL, float(claims.get('exp', 0)))
+    if valid_until > now:
+        _token_cache[key] = (valid_until, claims)
+        while len(_token_cache) > _TOKEN_CACHE_MAX:
+            _token_cache.popitem(last=False)
+    return claims
+
 
 async def authenticate_websocket(websocket: WebSocket) -> Optional[dict]:
     """Wait for and validate authentication message.
@@ -39,10 +88,10 @@ async def authenticate_websocket(websocket: WebSocket) -> Optional[dict]:
             websocket.receive_text(),
             timeout=5.0
         )
-        message = json.loads(data)
+        message = orjson.loads(data)
 
         if message.get("type") != "auth":
-            await websocket.send_json({
+            await _send_json(websocket, {
                 "type": "error",
                 "code": "INVALID_AUTH_MESSAGE",
                 "message": "First message must be auth type"
@@ -51,7 +100,7 @@ async def authenticate_websocket(websocket: WebSocket) -> Optional[dict]:
 
         token = message.get("token")
         if not token:
-            await websocket.send_json({
+            await _send_json(websocket, {
                 "type": "error",
                 "code": "MISSING_TOKEN",
                 "message": "Token is required"
@@ -59,25 +108,25 @@ async def authenticate_websocket(websocket: WebSocket) -> Optional[dict]:
             return None
 
         # Verify Firebase token
-        claims = await verify_firebase_token(token)
+        claims = await _verify_token_cached(token)
         return claims
 
     except asyncio.TimeoutError:
-        await websocket.send_json({
+        await _send_json(websocket, {
             "type": "error",
             "code": "AUTH_TIMEOUT",
             "message": "Authentication timeout"
         })
         return None
     except ValueError as e:
-        await websocket.send_json({
+        await _send_json(websocket, {
             "type": "error",
             "code": "AUTH_FAILED",
             "message": str(e)
         })
         return None
-    except json.JSONDecodeError:
-        await websocket.send_json({
+    except orjson.JSONDecodeError:
+        await _send_json(websocket, {
             "type": "error",
             "code": "INVALID_JSON",
             "message": "Invalid JSON message"
@@ -108,7 +157,7 @@ async def stt_websocket(websocket: WebSocket):
     user_id = user_claims.get("uid", "unknown")
     print(f"[STT WebSocket] User {user_id} authenticated")
 
-    await websocket.send_json({"type": "auth_success"})
+    await _send_json(websocket, {"type": "auth_success"})
 
     # Step 2: Create STT session
     stt_session = SpeechToTextSession(
@@ -117,17 +166,12 @@ async def stt_websocket(websocket: WebSocket):
         enable_interim_results=True,
     )
 
-    # Track tasks for cleanup
-    process_task: Optional[asyncio.Task] = None
-    receive_task: Optional[asyncio.Task] = None
-
     try:
-        # Start processing audio in background
         async def process_and_send():
             """Process audio stream and send transcripts to client."""
             try:
                 async for result in stt_session.process_audio_stream():
-                    await websocket.send_json({
+                    await _send_json(websocket, {
                         "type": "transcript",
                         "text": result["text"],
                         "is_final": result["is_final"],
@@ -135,7 +179,7 @@ async def stt_websocket(websocket: WebSocket):
             except Exception as e:
                 print(f"[STT WebSocket] Processing error: {e}")
                 try:
-                    await websocket.send_json({
+                    await _send_json(websocket, {
                         "type": "error",
                         "code": "STT_ERROR",
                         "message": str(e),
@@ -143,45 +187,65 @@ async def stt_websocket(websocket: WebSocket):
                 except Exception:
                     pass
 
-        # Start the processing task
-        process_task = asyncio.create_task(process_and_send())
-
         # Step 3: Receive audio chunks
         async def receive_audio():
-            """Receive and queue audio chunks from client."""
-            while True:
-                try:
-                    message = await websocket.receive()
-
-                    if message["type"] == "websocket.disconnect":
-                        break
-
-                    if "bytes" in message:
-                        # Binary audio data
-                        await stt_session.add_audio(message["bytes"])
-
-                    elif "text" in message:
-                        # JSON control message
-                        try:
-                            data = json.loads(message["text"])
-                            if data.get("type") == "stop":
-                                print(f"[STT WebSocket] Stop requested by user {user_id}")
-                                break
-                        except json.JSONDecodeError:
-                            pass
-
-                except WebSocketDisconnect:
-                    break
+            """Receive audio chunks from client, coalescing small frames."""
+            buffer = bytearray()
+            last_flush = time.monotonic()
 
-        receive_task = asyncio.create_task(receive_audio())
+            async def flush():
+                nonlocal last_flush
+                if buffer:
+                    await stt_session.add_audio(bytes(buffer))
+                    buffer.clear()
+                last_flush = time.monotonic()
 
-        # Wait for receive task to complete
-        await receive_task
+            try:
+                while True:
+                    try:
+                        message = await websocket.receive()
+
+                        if message["type"] == "websocket.disconnect":
+                            break
+
+                        chunk = message.get("bytes")
+                        if chunk is not None:
+                            # Binary audio data; batch before handing to STT
+                            buffer.extend(chunk)
+                            if (len(buffer) >= _AUDIO_BATCH_BYTES
+                                    or time.monotonic() - last_flush >= _AUDIO_BATCH_MAX_DELAY):
+                                await flush()
+
+                        elif "text" in message:
+                            # JSON control message
+                            try:
+                                data = orjson.loads(message["text"])
+                                if data.get("type") == "stop":
+                                    print(f"[STT WebSocket] Stop requested by user {user_id}")
+                                    break
+                            except orjson.JSONDecodeError:
+                                pass
+
+                    except WebSocketDisconnect:
+                        break
+            finally:
+                # Hand any tail audio to STT before the session stops
+                await flush()
+
+        # TaskGroup ties the two tasks' lifetimes together: if either one
+        # fails, the other is cancelled, and nothing is left dangling when
+        # the block exits.
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(process_and_send())
+            await tg.create_task(receive_audio())
+            # Receive side is done; end the audio stream so the processing
+            # task's generator finishes and the group can exit.
+            await stt_session.stop()
 
     except Exception as e:
         print(f"[STT WebSocket] Error: {e}")
         try:
-            await websocket.send_json({
+            await _send_json(websocket, {
                 "type": "error",
                 "code": "SERVER_ERROR",
                 "message": str(e),
@@ -193,24 +257,9 @@ async def stt_websocket(websocket: WebSocket):
         # Cleanup
         print(f"[STT WebSocket] Cleaning up for user {user_id}")
 
-        # Stop STT session
+        # Stop STT session (no-op if the group already stopped it)
         await stt_session.stop()
 
-        # Cancel tasks
-        if receive_task and not receive_task.done():
-            receive_task.cancel()
-            try:
-                await receive_task
-            except asyncio.CancelledError:
-                pass
-
-        if process_task and not process_task.done():
-            process_task.cancel()
-            try:
-                await process_task
-            except asyncio.CancelledError:
-                pass
-
         # Close WebSocket
         try:
             await websocket.close()
@@ -18,7 +18,7 @@ from app.models.text_interview import (
     TextInterviewMessageResponse,
     TextInterviewStateResponse,
 )
-from app.routers.session import get_user_active_session
+from app.routers.session import get_user_active_session, invalidate_active_session
 from app.services.text_interview_service import (
     delete_interview_state,
     end_interview,
@@ -99,8 +99,9 @@ async def start_text_interview_endpoint(
         # Update session status and interview mode
         try:
             db.collection("sessions").document(session_id).update(
-                {"status": "interviewing", "interview_mode": "text"}
+                {"status": "interviewing", "is_active": True, "interview_mode": "text"}
             )
+            invalidate_active_session(user.uid)
         except Exception as e:
             print(f"[TextInterview] Failed to update session status: {e}")
 
@@ -298,8 +299,9 @@ async def end_interview_endpoint(
         # Update session status
         try:
             db.collection("sessions").document(session_id).update(
-                {"status": "completed"}
+                {"status": "completed", "is_active": False}
             )
+            invalidate_active_session(user.uid)
         except Exception as e:
             print(f"[TextInterview] Failed to update session status: {e}")
 
@@ -16,6 +16,7 @@ import base64
 from datetime import datetime
 from typing import Optional, Any, Literal, AsyncGenerator
 
+import httpx
 from google import genai
 from google.genai.types import GenerateContentConfig, HttpOptions
 
@@ -41,6 +42,21 @@ else:
 # Global client instance
 _client: genai.Client | None = None
 
+# Connection-pool limits for the shared Gemini HTTP client. Each resume upload
+# fans out up to four concurrent calls (basic, career, ATS, improve), so the
+# pool is sized to let ~10 uploads run in flight without serializing on the
+# default httpx limits.
+_HTTP_LIMITS = httpx.Limits(max_connections=40, max_keepalive_connections=20)
+
+
+def _http_options() -> HttpOptions:
+    """HTTP options for the genai client with an explicitly sized pool."""
+    return HttpOptions(
+        api_version="v1",
+        client_args={"limits": _HTTP_LIMITS},
+        async_client_args={"limits": _HTTP_LIMITS},
+    )
+
 
 def get_client() -> genai.Client:
     """Get or create the genai client."""
@@ -50,12 +66,12 @@ def get_client() -> genai.Client:
             # Initialize with API key for Google AI Studio
             _client = genai.Client(
                 api_key=settings.gcp_api_key,
-                http_options=HttpOptions(api_version="v1")
+                http_options=_http_options()
             )
             print("[Gemini] Initialized google.genai client with API key")
         else:
             # Initialize for Vertex AI (uses ADC)
-            _client = genai.Client(http_options=HttpOptions(api_version="v1"))
+            _client = genai.Client(http_options=_http_options())
             print("[Gemini] Initialized google.genai client for Vertex AI")
     return _client
 
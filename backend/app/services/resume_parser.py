@@ -4,15 +4,17 @@ import io
 import re
 from typing import Optional
 
-from pypdf import PdfReader
-from docx import Document
-
 from app.models.resume import ResumeData, ATSAnalysis, ATSIssue, KeywordGap
 from app.services.gemini_service import parse_resume_with_gemini, calculate_ats_score_and_keywords
 
+# pypdf and python-docx are imported lazily on first use: they are heavy
+# imports that requests other than file parsing never need.
+_PdfReader = None
+_DocxDocument = None
+
 
-async def parse_resume_file(content: bytes, content_type: str) -> ResumeData:
-    """Parse resume content from PDF or DOCX file."""
+async def parse_resume_file(content, content_type: str) -> ResumeData:
+    """Parse resume content (bytes or a binary file object) from PDF or DOCX."""
     if content_type == "application/pdf":
         text = _extract_pdf_text(content)
     else:
@@ -94,17 +96,18 @@ async def parse_resume_file(content: bytes, content_type: str) -> ResumeData:
 
 
 
-def _extract_pdf_text(content: bytes) -> str:
-    """Extract text from PDF bytes."""
-    reader = PdfReader(io.BytesIO(content))
-    text_parts = []
-
-    for page in reader.pages:
-        text = page.extract_text()
-        if text:
-            text_parts.append(text)
+def _extract_pdf_text(content) -> str:
+    """Extract text from PDF bytes or a binary file object."""
+    global _PdfReader
+    if _PdfReader is None:
+        from pypdf import PdfReader as _PdfReader
+    reader = _PdfReader(io.BytesIO(content) if isinstance(content, bytes) else content)
 
-    return "\n".join(text_parts)
+    # Feed page text straight into the join instead of growing an
+    # intermediate list of page strings
+    return "\n".join(
+        text for page in reader.pages if (text := page.extract_text())
+    )
 
 
 
@@ -122,9 +125,12 @@ def _extract_pdf_text(content: bytes) -> str:
 
 
 
-def _extract_docx_text(content: bytes) -> str:
-    """Extract text from DOCX bytes."""
-    doc = Document(io.BytesIO(content))
+def _extract_docx_text(content) -> str:
+    """Extract text from DOCX bytes or a binary file object."""
+    global _DocxDocument
+    if _DocxDocument is None:
+        from docx import Document as _DocxDocument
+    doc = _DocxDocument(io.BytesIO(content) if isinstance(content, bytes) else content)
     text_parts = []
 
     for paragraph in doc.paragraphs:
@@ -5,6 +5,7 @@ This service handles resume file upload, download URL generation,
 and deletion for the resume versioning system.
 """
 
+import asyncio
 import os
 import uuid
 import traceback
@@ -88,7 +89,7 @@ def get_bucket():
 
 async def upload_resume_file(
     user_id: str,
-    file_content: bytes,
+    file_content,
     file_name: str,
     content_type: str,
     is_improved: bool = False,
@@ -99,7 +100,7 @@ async def upload_resume_file(
 
     Args:
         user_id: Firebase user UID
-        file_content: File bytes
+        file_content: File bytes or a binary file object
         file_name: Original filename
         content_type: MIME type (application/pdf or docx mime type)
         is_improved: Whether this is an AI-improved version
@@ -143,8 +144,13 @@ async def upload_resume_file(
         if source_version_id:
             blob.metadata["source_version_id"] = source_version_id
 
-        # Upload the file first
-        blob.upload_from_string(file_content, content_type=content_type)
+        # Upload the file first; file objects stream straight into the blob
+        # without the extra buffer copy upload_from_string would make
+        if isinstance(file_content, (bytes, bytearray)):
+            blob.upload_from_string(file_content, content_type=content_type)
+        else:
+            file_content.seek(0)
+            blob.upload_from_file(file_content, content_type=content_type)
         print(f"[Storage] Uploaded resume: {storage_path} (version: {version_id})")
 
     except Exception as e:
@@ -248,17 +254,22 @@ async def delete_all_user_resumes(user_id: str) -> int:
     prefix = f"resumes/{user_id}/"
 
     try:
-        bucket = get_bucket()
-        blobs = bucket.list_blobs(prefix=prefix)
-
-        for blob in blobs:
-            try:
-                blob.delete()
-                deleted_count += 1
-                print(f"[Storage] Deleted: {blob.name}")
-            except Exception as e:
-                print(f"[Storage] Failed to delete {blob.name}: {e}")
-
+        # Listing and deleting blobs blocks, so the whole sweep runs in a
+        # worker thread; account deletion gathers this alongside the
+        # Firestore collection scans
+        def _delete_blobs() -> int:
+            bucket = get_bucket()
+            count = 0
+            for blob in bucket.list_blobs(prefix=prefix):
+                try:
+                    blob.delete()
+                    count += 1
+                    print(f"[Storage] Deleted: {blob.name}")
+                except Exception as e:
+                    print(f"[Storage] Failed to delete {blob.name}: {e}")
+            return count
+
+        deleted_count = await asyncio.to_thread(_delete_blobs)
         print(f"[Storage] Deleted {deleted_count} resume files for user {user_id}")
         return deleted_count
 
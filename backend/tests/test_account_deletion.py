@@ -29,7 +29,7 @@ class TestDeleteCollectionByUserId:
         mock_batch.commit = MagicMock()
 
         mock_collection = MagicMock()
-        mock_collection.where.return_value.stream.return_value = [mock_doc1, mock_doc2]
+        mock_collection.where.return_value.select.return_value.stream.return_value = [mock_doc1, mock_doc2]
 
         mock_db = MagicMock()
         mock_db.collection.return_value = mock_collection
@@ -47,7 +47,7 @@ class TestDeleteCollectionByUserId:
     async def test_delete_collection_empty(self):
         """Test deletion when no documents exist."""
         mock_collection = MagicMock()
-        mock_collection.where.return_value.stream.return_value = []
+        mock_collection.where.return_value.select.return_value.stream.return_value = []
 
         mock_db = MagicMock()
         mock_db.collection.return_value = mock_collection
@@ -68,7 +68,7 @@ class TestDeleteCollectionByUserId:
         mock_batch.commit.side_effect = Exception("Firestore error")
 
         mock_collection = MagicMock()
-        mock_collection.where.return_value.stream.return_value = [mock_doc]
+        mock_collection.where.return_value.select.return_value.stream.return_value = [mock_doc]
 
         mock_db = MagicMock()
         mock_db.collection.return_value = mock_collection
@@ -86,7 +86,7 @@ class TestDeleteSavedJobs:
 
     @pytest.mark.asyncio
     async def test_delete_saved_jobs_success(self):
-        """Test successful deletion of saved jobs by uid prefix."""
+        """Test successful deletion of saved jobs via the doc-ID range query."""
         mock_doc1 = MagicMock()
         mock_doc1.id = "test-uid-123_job-abc"
         mock_doc1.reference = MagicMock()
@@ -95,15 +95,13 @@ class TestDeleteSavedJobs:
         mock_doc2.id = "test-uid-123_job-def"
         mock_doc2.reference = MagicMock()
 
-        mock_doc3 = MagicMock()  # Different user's job
-        mock_doc3.id = "other-user_job-xyz"
-        mock_doc3.reference = MagicMock()
-
         mock_batch = MagicMock()
         mock_batch.commit = MagicMock()
 
         mock_collection = MagicMock()
-        mock_collection.stream.return_value = [mock_doc1, mock_doc2, mock_doc3]
+        # The __name__ range query returns only this user's docs server-side
+        mock_collection.where.return_value.where.return_value.select.return_value.stream.return_value = [
+            mock_doc1, mock_doc2]
 
         mock_db = MagicMock()
         mock_db.collection.return_value = mock_collection
@@ -112,17 +110,14 @@ class TestDeleteSavedJobs:
         with patch('app.services.account_deletion_service.get_firestore_client', return_value=mock_db):
             result = await _delete_saved_jobs('test-uid-123')
 
-        assert result == 2  # Only 2 docs belong to the test user
+        assert result == 2
         assert mock_batch.delete.call_count == 2
 
     @pytest.mark.asyncio
     async def test_delete_saved_jobs_none(self):
         """Test deletion when user has no saved jobs."""
-        mock_doc = MagicMock()
-        mock_doc.id = "other-user_job-xyz"
-
         mock_collection = MagicMock()
-        mock_collection.stream.return_value = [mock_doc]
+        mock_collection.where.return_value.where.return_value.select.return_value.stream.return_value = []
 
         mock_db = MagicMock()
         mock_db.collection.return_value = mock_collection
@@ -239,7 +234,7 @@ class TestDeleteUserAccount:
         mock_batch.commit = MagicMock()
 
         mock_collection = MagicMock()
-        mock_collection.where.return_value.stream.return_value = [mock_doc]
+        mock_collection.where.return_value.select.return_value.stream.return_value = [mock_doc]
         mock_collection.stream.return_value = [mock_doc]
         mock_collection.document.return_value.delete = MagicMock()
 
@@ -265,7 +260,7 @@ class TestDeleteUserAccount:
     async def test_account_deletion_with_no_data(self):
         """Test deletion for user with no data in any collection."""
         mock_collection = MagicMock()
-        mock_collection.where.return_value.stream.return_value = []
+        mock_collection.where.return_value.select.return_value.stream.return_value = []
         mock_collection.stream.return_value = []
         mock_collection.document.return_value.delete = MagicMock()
 
@@ -285,7 +280,7 @@ class TestDeleteUserAccount:
     async def test_account_deletion_partial_failure(self):
         """Test deletion continues on partial failures."""
         mock_collection = MagicMock()
-        mock_collection.where.return_value.stream.side_effect = Exception("Firestore error")
+        mock_collection.where.return_value.select.return_value.stream.side_effect = Exception("Firestore error")
         mock_collection.stream.return_value = []
         mock_collection.document.return_value.delete = MagicMock()
 
@@ -305,7 +300,7 @@ class TestDeleteUserAccount:
     async def test_account_deletion_auth_failure(self):
         """Test failure when Firebase Auth deletion fails."""
         mock_collection = MagicMock()
-        mock_collection.where.return_value.stream.return_value = []
+        mock_collection.where.return_value.select.return_value.stream.return_value = []
         mock_collection.stream.return_value = []
         mock_collection.document.return_value.delete = MagicMock()
 
@@ -326,7 +321,7 @@ class TestDeleteUserAccount:
     async def test_account_deletion_idempotent(self):
         """Test that deletion can be called multiple times safely."""
         mock_collection = MagicMock()
-        mock_collection.where.return_value.stream.return_value = []
+        mock_collection.where.return_value.select.return_value.stream.return_value = []
         mock_collection.stream.return_value = []
         mock_collection.document.return_value.delete = MagicMock()
 